@@ -1,22 +1,42 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import io
+import functools
+import itertools
+import operator
 import threading
+import concurrent.futures
+import queue
+from collections import Counter
 from contextlib import redirect_stdout
 import random
 import os
+import sys
 import json
 
 from PIL import Image
 import sim
 
 # Global state
-sort_state = {}
-comp_name_to_id = {}
 bookmarked_teams = set()
 current_theme = "dark"
 
+# Lines kept in the simulation output box; older lines are dropped
+OUTPUT_MAX_LINES = 5000
+
+# Team graph canvas size and rating series as (attribute, colour, legend label)
+GRAPH_WIDTH = 360
+GRAPH_HEIGHT = 200
+GRAPH_MARGIN = 30
+RATING_MIN = 50
+RATING_MAX = 100
+RATING_SERIES = (
+    ("attack", "red", "ATT"),
+    ("midfield", "yellow", "MID"),
+    ("defense", "cyan", "DEF"),
+    ("goalkeeping", "magenta", "GOA"),
+)
+
 
 class SimpleTooltip:
     """Tooltip widget for hover information."""
@@ -49,6 +69,211 @@ class SimpleTooltip:
             self.tipwindow = None
 
 
+class QueueWriter:
+    """File-like sink that forwards writes to a queue as ("text", chunk)."""
+    def __init__(self, q):
+        self.q = q
+
+    def write(self, s):
+        if s:
+            self.q.put(("text", s))
+        return len(s)
+
+    def flush(self):
+        pass
+
+
+class VirtualButtonList(ctk.CTkFrame):
+    """Scrollable button list that only materializes the visible rows.
+
+    Rows are (text, payload) pairs; clicking a row calls command(payload).
+    A small pool of buttons is placed on a canvas and reconfigured as the
+    list scrolls, so building the list costs the same whether it holds ten
+    rows or a thousand.
+    """
+    def __init__(self, master, command=None, button_height=30, spacing=4, **kwargs):
+        super().__init__(master, **kwargs)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.command = command
+        self.button_height = button_height
+        self.spacing = spacing
+        self.rows = []
+        self._pool = []
+        self._pool_rows = []
+        self._row_px = self._scaled(button_height + spacing)
+
+        self.canvas = tk.Canvas(
+            self, highlightthickness=0, borderwidth=0,
+            yscrollincrement=self._row_px, bg=self._canvas_color()
+        )
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self._bind_wheel(self.canvas)
+
+    def _scaled(self, value):
+        return int(round(self._apply_widget_scaling(value)))
+
+    def _row_color(self):
+        color = self.cget("fg_color")
+        if color == "transparent":
+            color = self.cget("bg_color")
+        return color
+
+    def _canvas_color(self):
+        return self._apply_appearance_mode(self._row_color())
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self.canvas.configure(bg=self._canvas_color())
+
+    def _set_scaling(self, *args, **kwargs):
+        super()._set_scaling(*args, **kwargs)
+        self._row_px = self._scaled(self.button_height + self.spacing)
+        self.canvas.configure(yscrollincrement=self._row_px)
+        self._pool_rows = [None] * len(self._pool)
+        self._update_scrollregion()
+        self._refresh()
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_mousewheel)
+        widget.bind("<Button-4>", self._on_mousewheel)
+        widget.bind("<Button-5>", self._on_mousewheel)
+
+    def _on_mousewheel(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.canvas.yview_scroll(-1, "units")
+        else:
+            self.canvas.yview_scroll(1, "units")
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._refresh()
+
+    def _on_configure(self, event):
+        width = max(1, event.width - self._scaled(8))
+        for _, item in self._pool:
+            self.canvas.itemconfigure(item, width=width)
+        self._update_scrollregion()
+        self._refresh()
+
+    def _update_scrollregion(self):
+        self.canvas.configure(
+            scrollregion=(0, 0, self.canvas.winfo_width(), len(self.rows) * self._row_px)
+        )
+
+    def set_rows(self, rows):
+        """Replace the list contents with (text, payload) pairs."""
+        self.rows = list(rows)
+        self._pool_rows = [None] * len(self._pool)
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self._refresh()
+
+    def _on_click(self, slot):
+        index = self._pool_rows[slot]
+        if self.command is not None and index is not None and index < len(self.rows):
+            self.command(self.rows[index][1])
+
+    def _refresh(self):
+        """Point the pooled buttons at the rows inside the viewport."""
+        first = max(0, int(self.canvas.canvasy(0)) // self._row_px)
+        visible = self.canvas.winfo_height() // self._row_px + 2
+        last = min(len(self.rows), first + visible)
+
+        if len(self._pool) < last - first:
+            width = max(1, self.canvas.winfo_width() - self._scaled(8))
+            while len(self._pool) < last - first:
+                button = ctk.CTkButton(
+                    self.canvas, height=self.button_height, bg_color=self._row_color(),
+                    command=functools.partial(self._on_click, len(self._pool))
+                )
+                self._bind_wheel(button)
+                item = self.canvas.create_window(
+                    self._scaled(4), 0, anchor="nw", window=button, width=width
+                )
+                self._pool.append((button, item))
+            # Slot assignment depends on the pool size, so start over
+            self._pool_rows = [None] * len(self._pool)
+
+        # Rows map onto slots round-robin, so scrolling by one row only
+        # reconfigures the one button that wrapped around.
+        pool_size = len(self._pool)
+        shown = set()
+        for index in range(first, last):
+            slot = index % pool_size
+            shown.add(slot)
+            button, item = self._pool[slot]
+            if self._pool_rows[slot] != index:
+                button.configure(text=self.rows[index][0])
+                self.canvas.coords(item, self._scaled(4), index * self._row_px + self._scaled(self.spacing // 2))
+                self._pool_rows[slot] = index
+            self.canvas.itemconfigure(item, state="normal")
+        for slot, (_, item) in enumerate(self._pool):
+            if slot not in shown:
+                self.canvas.itemconfigure(item, state="hidden")
+
+
+_TEAM_LOGO_DIR = os.path.join(sim.DATA_DIR, "europe", "germany", "logos")
+_COMP_LOGO_DIR = os.path.join(sim.DATA_DIR, "europe", "germany", "leaguelogos")
+_TROPHY_DIR = os.path.join(sim.DATA_DIR, "europe", "germany", "trophies")
+IMAGE_DIRS = (_TEAM_LOGO_DIR, _COMP_LOGO_DIR, _TROPHY_DIR)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_image_dir(folder_path):
+    """Return the file names in an image folder, listed once per session."""
+    try:
+        return frozenset(os.listdir(folder_path))
+    except OSError:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=512)
+def _decode_image(path):
+    """Open and fully decode a PNG (None if missing). Safe off the Tk thread."""
+    folder_path, name = os.path.split(path)
+    if name not in _list_image_dir(folder_path):
+        return None
+    try:
+        img = Image.open(path)
+        img.load()
+    except Exception:
+        return None
+    return img
+
+
+@functools.lru_cache(maxsize=512)
+def _load_image(path, w, h):
+    """Load a PNG as a CTkImage, cached by path and size (None if missing)."""
+    img = _decode_image(path)
+    if img is None:
+        return None
+    # CTkImage rescales its source on every scaling change, so hand it a
+    # copy already reduced to twice the display size (enough for HiDPI)
+    small = img.copy()
+    small.thumbnail((w * 2, h * 2))
+    return ctk.CTkImage(light_image=small, dark_image=small, size=(w, h))
+
+
+def _preload_images():
+    """Decode every logo and trophy PNG in parallel to warm the image cache."""
+    paths = []
+    for folder_path in IMAGE_DIRS:
+        for name in _list_image_dir(folder_path):
+            if name.endswith(".png"):
+                paths.append(os.path.join(folder_path, name))
+    if not paths:
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        list(pool.map(_decode_image, paths))
+
+
 class App(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -69,6 +294,20 @@ class App(ctk.CTk):
 
         # Widget references
         self.table_tree = None
+        self.comp_table = None
+        self.team_records_box = None
+        self._table_rows = []
+        self._table_values = {}
+        self._table_lnames = {}     # item id -> lowercase team name
+        self._iid_team = {}         # item id -> team id
+        self._last_query = ""
+        self._last_matched = set()
+        self._table_source = None
+        self._sort_state = {}       # column -> next sort is ascending
+        self._sorted_by = None      # column _table_rows is currently sorted on
+        self._comp_name_to_id = {}  # league name -> compId
+        self._league_names = []     # league names for the selector, by compId
+        self._shown_league_names = None
         self.output_box = None
         self.comp_select = None
         self.season_select = None
@@ -82,7 +321,33 @@ class App(ctk.CTk):
         self._comp_logo_image = None
 
         self._continent_map = {}
+        self._continent_views = {}
+        self._positions_cache = {}
+        self._trophies_cache = {}
+        self._records_text_cache = {}
+        self._records_index = {}
+        self._titles_index = None
+        self._prebuilt_titles = None  # (world state, titles index) from a worker
+        self._winners_index = {}
+        self._comp_rep_lines = {}
+        self._winners_source = (None, None)
+        self._winners_seen = (0, 0)
+        self._nav_state = None
+        self._country_views = {}
         self._nation_key_map = {}
+        self._slug_to_folder = {}
+        self._cont_obj_by_folder = {}
+
+        # Sorted navigation lists (rebuilt by _build_nav_caches)
+        self._continents_sorted = []
+        self._countries_sorted = []
+        self._countries_by_continent = {}
+        self._comps_sorted = []
+        self._home_list_rows = ([], [], [])
+        self._comps_by_nation = {}
+        self._comps_by_continent_domestic = {}
+        self._comps_continental = {}
+        self._clubs_by_nation = {}
 
         self.current_continent_folder = None
         self.current_country_cont_folder = None
@@ -90,21 +355,33 @@ class App(ctk.CTk):
         self.current_competition_id = None
 
         self.simulation_running = False
+        self._output_queue = None
+        self.world_loaded = False
+        self._pending_table_update = False
+        self._filter_after_id = None
+        self._tab_dirty = dict.fromkeys(
+            ("home", "league", "continent", "country", "competition", "team", "stats"), True)
+        self._refresh_pending = False
+        self._team_tab_sig = None
+        self._team_graph_sig = None
+        self._ratings_frame_key = None
+        self._pos_frame_key = None
+        self._comp_tab_sig = None
+        self._load_queue = queue.Queue()
 
         # Setup keyboard shortcuts
         self._setup_keyboard_shortcuts()
 
         # Build UI
         self._build_header()
-        sim.load_world()
         self._build_tabs()
 
-        self._update_season_selector()
-        self._populate_competitions()
-        self._update_table_for_competition()
+        # Bookmark writes run in order on a single worker thread
+        self._bookmark_writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
-        # Load bookmarks
-        self._load_bookmarks()
+        # Load bookmarks and world data off the Tk thread
+        threading.Thread(target=self._bg_load, daemon=True).start()
+        self.after(50, self._drain_load_queue)
 
     # ==================== Keyboard Shortcuts ====================
 
@@ -122,15 +399,27 @@ class App(ctk.CTk):
         self.bind("<Control-T>", lambda e: self._toggle_theme())
         self.bind("<Control-b>", lambda e: self._toggle_bookmark_current_team())
         self.bind("<Control-B>", lambda e: self._toggle_bookmark_current_team())
-        self.bind("<F5>", lambda e: self._refresh_all())
+        self.bind("<F5>", lambda e: self._schedule_refresh())
 
     # ==================== Helpers ====================
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _slug(s: str) -> str:
-        return "".join(ch for ch in s.lower() if ch.isalnum())
+        return sim._slug(s)
 
-    def _to_stars(self, value):
+    @staticmethod
+    def _pick(d, *keys):
+        """Return the first non-None value among keys, else None."""
+        for k in keys:
+            v = d.get(k)
+            if v is not None:
+                return v
+        return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _to_stars(value):
         try:
             v = int(value)
         except (ValueError, TypeError):
@@ -148,6 +437,242 @@ class App(ctk.CTk):
         half = (stars - full) >= 0.25
         return "★" * full + ("☆" if half else "")
 
+    # ==================== World Loading ====================
+
+    def _bg_load(self):
+        """Load world data and build navigation caches (worker thread)."""
+        try:
+            self._load_bookmarks()
+            sim.load_world()
+            self._build_nav_caches()
+            nav_state = self._world_state()
+            _preload_images()
+        except Exception as e:
+            self._load_queue.put(("error", e))
+            return
+        # The titles index is only a warm cache; rebuild it lazily on failure
+        try:
+            titles_index = self._build_titles_index()
+        except Exception:
+            titles_index = None
+        self._load_queue.put(("done", (nav_state, titles_index)))
+
+    def _drain_load_queue(self):
+        """Poll for the background load result and populate the UI."""
+        try:
+            kind, payload = self._load_queue.get_nowait()
+        except queue.Empty:
+            self.after(50, self._drain_load_queue)
+            return
+
+        if kind == "error":
+            message = f"Failed to load world data:\n{payload}"
+            messagebox.showerror("Load Error", message)
+            self._show_placeholder(self.home_tab, message)
+            self._show_placeholder(self.stats_tab, message)
+            return
+
+        self._nav_state, self._titles_index = payload
+        self.world_loaded = True
+        self._update_season_selector()
+        self._populate_competitions()
+        self._build_visible_tab()
+
+    def _show_loading(self, tab):
+        """Show a loading placeholder on a tab."""
+        self._show_placeholder(tab, "Loading…")
+
+    def _show_placeholder(self, tab, text):
+        """Replace a tab's contents with a single centred message."""
+        for w in tab.winfo_children():
+            w.destroy()
+        tab.rowconfigure(0, weight=1)
+        tab.columnconfigure(0, weight=1)
+        ctk.CTkLabel(
+            tab, text=text,
+            font=ctk.CTkFont(size=16, weight="bold"),
+            justify="center"
+        ).grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+
+    # ==================== Navigation Caches ====================
+
+    def _build_nav_caches(self):
+        """Precompute the sorted continent/country/competition/club lists."""
+        self._continent_map.clear()
+        self._nation_key_map.clear()
+        self._slug_to_folder.clear()
+        self._cont_obj_by_folder.clear()
+
+        for fk in sim.NATIONS_BY_CONTINENT:
+            self._slug_to_folder.setdefault(self._slug(fk), fk)
+
+        continent_rows = []
+        for c in sim.CONTINENTS:
+            name = c.get("continentName", "Unknown")
+            rep_val = c.get("reputation", c.get("continentReputation", 0))
+            folder_match = self._slug_to_folder.get(self._slug(name))
+            if folder_match is None:
+                continue
+            self._continent_map[name] = folder_match
+            self._cont_obj_by_folder.setdefault(folder_match, c)
+            continent_rows.append((rep_val or 0, name, folder_match))
+
+        continent_rows.sort(key=lambda x: x[0], reverse=True)
+
+        country_rows = []
+        for cont_folder, nations in sim.NATIONS_BY_CONTINENT.items():
+            for n in nations:
+                nid = n.get("nationId")
+                name = n.get("nationName", f"Nation {nid}")
+                rep_val = n.get("reputation", n.get("nationReputation", 0)) or 0
+                label = name
+                country_rows.append((rep_val, label, cont_folder, nid, n))
+                self._nation_key_map.setdefault((cont_folder, nid), n)
+        country_rows.sort(key=lambda x: x[0], reverse=True)
+
+        # Keep the highest-reputation (rep, name) per competition id
+        best_comp = {}
+        all_comps = itertools.chain(
+            itertools.chain.from_iterable(sim.CONTINENT_LEVEL_COMPS.values()),
+            itertools.chain.from_iterable(sim.NATION_COMPS.values()),
+        )
+        for comp in all_comps:
+            cid = comp.get("compId")
+            if cid is None:
+                continue
+            rep_val = comp.get("reputation", comp.get("compReputation", 0)) or 0
+            cur = best_comp.get(cid)
+            if cur is None or rep_val > cur[0]:
+                best_comp[cid] = (rep_val, comp.get("compName", f"Comp {cid}"))
+
+        comp_rows = [(rep_val, cname, cid) for cid, (rep_val, cname) in best_comp.items()]
+        comp_rows.sort(key=operator.itemgetter(0), reverse=True)
+
+        self._continents_sorted = continent_rows
+        self._countries_sorted = country_rows
+        self._comps_sorted = comp_rows
+
+        # Home tab button labels, formatted once per world load
+        to_stars = self._to_stars
+        self._home_list_rows = (
+            [(f"{name}   {to_stars(rep_val)}", folder)
+             for rep_val, name, folder in continent_rows],
+            [(f"{label}   {to_stars(rep_val)}", (cont_folder, nid))
+             for rep_val, label, cont_folder, nid, _ in country_rows],
+            [(f"{cname}   {to_stars(rep_val)}", cid)
+             for rep_val, cname, cid in comp_rows],
+        )
+
+        countries_by_continent = {}
+        for cont_folder, nations in sim.NATIONS_BY_CONTINENT.items():
+            rows = []
+            for n in nations:
+                nid = n.get("nationId")
+                name = n.get("nationName", f"Nation {nid}")
+                rep_val = n.get("reputation", n.get("nationReputation", 0)) or 0
+                rows.append((rep_val, name, nid, n))
+            rows.sort(key=lambda x: x[0], reverse=True)
+            countries_by_continent[cont_folder] = rows
+        self._countries_by_continent = countries_by_continent
+
+        comps_by_nation = {}
+        comps_domestic = {}
+        for (cf, nid), folder in sim.NATION_FOLDERS.items():
+            nation_path = os.path.join(sim.DATA_DIR, cf, folder)
+            comps = sim.NATION_COMPS.get(nation_path, [])
+            rows = []
+            for comp in comps:
+                cid = comp.get("compId")
+                cname = comp.get("compName", f"Comp {cid}")
+                rep_val = comp.get("reputation", comp.get("compReputation", 0)) or 0
+                if cid is None:
+                    continue
+                rows.append((rep_val, cname, cid))
+            comps_domestic.setdefault(cf, []).extend(rows)
+            rows.sort(key=lambda x: x[0], reverse=True)
+            comps_by_nation[(cf, nid)] = rows
+        for rows in comps_domestic.values():
+            rows.sort(key=lambda x: x[0], reverse=True)
+        self._comps_by_nation = comps_by_nation
+        self._comps_by_continent_domestic = comps_domestic
+
+        comps_continental = {}
+        for cont_folder, comps in sim.CONTINENT_LEVEL_COMPS.items():
+            rows = []
+            for comp in comps:
+                # Only show true continental tournaments (format 5)
+                if comp.get("format") != 5:
+                    continue
+                cid = comp.get("compId")
+                cname = comp.get("compName", f"Comp {cid}")
+                rep_val = comp.get("reputation", comp.get("compReputation", 0)) or 0
+                if cid is None:
+                    continue
+                rows.append((rep_val, cname, cid))
+            rows.sort(key=lambda x: x[0], reverse=True)
+            comps_continental[cont_folder] = rows
+        self._comps_continental = comps_continental
+
+        # League selector entries
+        name_to_id = {}
+        format_get = sim.COMP_FORMAT.get
+        name_get = sim.COMP_NAME_LOOKUP.get
+        for cid in sorted(sim.COMP_TEAMS.keys()):
+            if format_get(cid) == 0:
+                name_to_id[name_get(cid, f"Competition {cid}")] = cid
+        self._comp_name_to_id = name_to_id
+        self._league_names = list(name_to_id)
+
+        # Collect unique clubs per nation based on teamNationId
+        clubs_maps = {}
+        for teams in sim.COMP_TEAMS.values():
+            for t in teams:
+                tid = t.get("teamId")
+                if tid is None:
+                    continue
+                clubs_map = clubs_maps.setdefault(t.get("teamNationId"), {})
+                if tid not in clubs_map:
+                    clubs_map[tid] = t
+        clubs_by_nation = {}
+        for nid, clubs_map in clubs_maps.items():
+            rows = [(t.get("reputationFactor", 0), tid, t) for tid, t in clubs_map.items()]
+            rows.sort(key=lambda x: x[0], reverse=True)
+            clubs_by_nation[nid] = rows
+        self._clubs_by_nation = clubs_by_nation
+
+    def _clear_views(self, views):
+        """Destroy cached tab views so they are rebuilt on next open."""
+        for view in views.values():
+            view.destroy()
+        views.clear()
+
+    def _world_state(self):
+        """Cheap fingerprint of the simulated state the caches derive from."""
+        return (sim.CURRENT_SEASON, id(sim.LEAGUE_HISTORY), len(sim.LEAGUE_HISTORY))
+
+    def _invalidate_caches(self):
+        """Rebuild derived navigation data after the world state changed."""
+        state = self._world_state()
+        if state == self._nav_state:
+            return
+        self._nav_state = state
+        self._build_nav_caches()
+        self._positions_cache.clear()
+        self._trophies_cache.clear()
+        self._records_text_cache.clear()
+        self._records_index.clear()
+        self._comp_rep_lines.clear()
+        self._winners_index = {}
+        self._winners_source = (None, None)
+        self._winners_seen = (0, 0)
+        # Use the titles index the simulation worker built, if it matches
+        prebuilt, self._prebuilt_titles = self._prebuilt_titles, None
+        self._titles_index = prebuilt[1] if prebuilt and prebuilt[0] == state else None
+        self._team_tab_sig = None
+        self._comp_tab_sig = None
+        self._clear_views(self._continent_views)
+        self._clear_views(self._country_views)
+
     # ==================== Theme Toggle ====================
 
     def _toggle_theme(self):
@@ -170,36 +695,72 @@ class App(ctk.CTk):
             try:
                 with open(bookmark_file, 'r') as f:
                     bookmarked_teams = set(json.load(f))
-            except:
+            except (OSError, ValueError, TypeError) as e:
+                print(f"[bookmarks] load failed: {e}", file=sys.stderr)
                 bookmarked_teams = set()
 
     def _save_bookmarks(self):
-        """Save bookmarked teams to file."""
+        """Save bookmarked teams to file on the bookmark writer thread."""
         bookmark_file = os.path.join(sim.BASE_DIR, "bookmarks.json")
+        self._bookmark_writer.submit(self._write_bookmarks, bookmark_file,
+                                     list(bookmarked_teams))
+
+    @staticmethod
+    def _write_bookmarks(bookmark_file, team_ids):
+        """Write bookmarks via a temp file so a crash never leaves half a file."""
+        tmp_file = bookmark_file + ".tmp"
         try:
-            with open(bookmark_file, 'w') as f:
-                json.dump(list(bookmarked_teams), f)
-        except:
-            pass
+            with open(tmp_file, 'w') as f:
+                json.dump(team_ids, f)
+            os.replace(tmp_file, bookmark_file)
+        except OSError as e:
+            print(f"[bookmarks] save failed: {e}", file=sys.stderr)
 
     def _toggle_bookmark_current_team(self):
         """Bookmark or unbookmark current team."""
-        if self.current_team_id is None:
-            messagebox.showinfo("No Team", "No team currently selected")
+        team_id = self.current_team_id
+        if team_id is None:
+            self._show_status("No team selected")
             return
-        
-        if self.current_team_id in bookmarked_teams:
-            bookmarked_teams.remove(self.current_team_id)
-            messagebox.showinfo("Bookmark", "Team removed from bookmarks")
+
+        if team_id in bookmarked_teams:
+            bookmarked_teams.remove(team_id)
+            self._show_status("☆ Removed from bookmarks")
         else:
-            bookmarked_teams.add(self.current_team_id)
-            messagebox.showinfo("Bookmark", "Team added to bookmarks")
-        
+            bookmarked_teams.add(team_id)
+            self._show_status("★ Bookmarked")
+
         self._save_bookmarks()
-        
-        # Refresh team tab to show bookmark status
-        if self.current_team_id:
-            self._open_team_tab(self.current_team_id)
+
+        # The club list of the team's nation shows bookmark markers, so only
+        # that nation's country view needs rebuilding
+        nation_id = sim.TEAM_ID_MAP.get(team_id, {}).get("teamNationId")
+        for key in [k for k in self._country_views if k[1] == nation_id]:
+            self._country_views.pop(key).destroy()
+        if self.current_country_nation_id == nation_id:
+            if self._tab_visible(self.country_tab):
+                self._reload_country_tab()
+            else:
+                self._tab_dirty["country"] = True
+
+        # Update the team tab's bookmark line in place if it shows this team
+        info = sim.TEAM_HISTORY.get(team_id)
+        bookmarked = team_id in bookmarked_teams
+        if (info is not None and self._team_tab_sig is not None and
+                self._team_tab_sig == self._team_tab_signature(team_id, info, not bookmarked)):
+            self._set_team_bookmark_label(bookmarked)
+            self._team_tab_sig = self._team_tab_signature(team_id, info, bookmarked)
+
+    def _show_status(self, text, duration=1500):
+        """Show a transient message in the header."""
+        if self._status_after_id is not None:
+            self.after_cancel(self._status_after_id)
+        self.status_label.configure(text=text)
+        self._status_after_id = self.after(duration, self._clear_status)
+
+    def _clear_status(self):
+        self._status_after_id = None
+        self.status_label.configure(text="")
 
     def _view_bookmarks(self):
         """Show bookmarked teams in a dialog."""
@@ -211,18 +772,21 @@ class App(ctk.CTk):
         dialog.title("Bookmarked Teams")
         dialog.geometry("400x500")
         
-        scroll_frame = ctk.CTkScrollableFrame(dialog)
-        scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        for tid in sorted(bookmarked_teams):
-            if tid in sim.TEAM_ID_MAP:
-                team = sim.TEAM_ID_MAP[tid]
-                btn = ctk.CTkButton(
-                    scroll_frame,
-                    text=team.get("teamName", f"Team {tid}"),
-                    command=lambda t=tid: [dialog.destroy(), self._open_team_tab(t)]
-                )
-                btn.pack(fill="x", pady=2)
+        team_map = sim.TEAM_ID_MAP
+        rows = sorted(
+            (team_map[tid].get("teamName", f"Team {tid}"), tid)
+            for tid in bookmarked_teams if tid in team_map
+        )
+
+        bookmark_list = VirtualButtonList(
+            dialog, command=functools.partial(self._open_bookmark, dialog))
+        bookmark_list.pack(fill="both", expand=True, padx=10, pady=10)
+        bookmark_list.set_rows(rows)
+
+    def _open_bookmark(self, dialog, team_id):
+        """Close the bookmarks dialog and open the chosen team."""
+        dialog.destroy()
+        self._open_team_tab(team_id)
 
     # ==================== Header ====================
 
@@ -269,11 +833,16 @@ class App(ctk.CTk):
         ctk.CTkLabel(header, text="Season view").grid(row=0, column=9, padx=5, pady=5, sticky="e")
         self.season_select = ctk.CTkComboBox(
             header, values=["No seasons"],
-            command=lambda _: self._update_table_for_competition(), width=140
+            command=lambda _: self._schedule_table_update(), width=140
         )
         self.season_select.set("No seasons")
         self.season_select.grid(row=0, column=10, padx=5, pady=5, sticky="e")
 
+        # Transient status messages
+        self.status_label = ctk.CTkLabel(header, text="")
+        self.status_label.grid(row=0, column=13, padx=10, pady=5, sticky="e")
+        self._status_after_id = None
+
         # Progress indicators
         self.progress_label = ctk.CTkLabel(header, text="")
         self.progress_label.grid(row=0, column=11, padx=10, pady=5, sticky="e")
@@ -281,7 +850,6 @@ class App(ctk.CTk):
         self.progress_bar = ctk.CTkProgressBar(header, width=200)
         self.progress_bar.grid(row=0, column=12, padx=5, pady=5, sticky="e")
         self.progress_bar.set(0)
-        self.progress_bar.grid_remove()
 
     # ==================== Tabs ====================
 
@@ -305,11 +873,54 @@ class App(ctk.CTk):
         self.notebook.add(self.comp_detail_tab, text="Competition")
         self.notebook.add(self.stats_tab, text="Statistics")
 
-        self._build_home_tab()
+        self._show_loading(self.home_tab)
         self._build_league_tab()
         self._build_empty_team_tab()
         self._build_empty_comp_tab()
-        self._build_stats_tab()
+        self._show_loading(self.stats_tab)
+
+        self._lazy_tabs = {
+            str(self.home_tab): ("home", self._build_home_tab),
+            str(self.league_tab): ("league", self._update_table_for_competition),
+            str(self.continent_tab): ("continent", self._reload_continent_tab),
+            str(self.country_tab): ("country", self._reload_country_tab),
+            str(self.comp_detail_tab): ("competition", self._reload_competition_tab),
+            str(self.team_tab): ("team", self._reload_team_tab),
+            str(self.stats_tab): ("stats", self._build_stats_tab),
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self._build_visible_tab())
+
+    def _tab_visible(self, tab):
+        return self.notebook.select() == str(tab)
+
+    def _reload_continent_tab(self):
+        if self.current_continent_folder is not None:
+            self._open_continent_tab(self.current_continent_folder)
+
+    def _reload_country_tab(self):
+        if self.current_country_nation_id is not None:
+            self._open_country_tab(self.current_country_cont_folder,
+                                   self.current_country_nation_id)
+
+    def _reload_competition_tab(self):
+        if self.current_competition_id is not None:
+            self._open_competition_tab(self.current_competition_id)
+
+    def _reload_team_tab(self):
+        if self.current_team_id is not None:
+            self._open_team_tab(self.current_team_id)
+
+    def _build_visible_tab(self):
+        """Rebuild the selected tab if it is lazily built and marked dirty."""
+        if not self.world_loaded:
+            return
+        entry = self._lazy_tabs.get(self.notebook.select())
+        if entry is None:
+            return
+        key, build = entry
+        if self._tab_dirty[key]:
+            self._tab_dirty[key] = False
+            build()
 
     def _build_league_tab(self):
         """Build the league viewing tab with search and filter."""
@@ -340,7 +951,7 @@ class App(ctk.CTk):
         ctk.CTkLabel(top_table_bar, text="Competition").grid(row=0, column=0, padx=5, pady=5, sticky="w")
         self.comp_select = ctk.CTkComboBox(
             top_table_bar, values=[],
-            command=lambda _: self._update_table_for_competition()
+            command=lambda _: self._schedule_table_update()
         )
         self.comp_select.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
 
@@ -358,7 +969,7 @@ class App(ctk.CTk):
         ctk.CTkLabel(search_bar, text="Search team:").grid(row=0, column=0, padx=5, sticky="w")
         self.search_entry = ctk.CTkEntry(search_bar, placeholder_text="Type to search...")
         self.search_entry.grid(row=0, column=1, padx=5, sticky="ew")
-        self.search_entry.bind("<KeyRelease>", lambda e: self._filter_table())
+        self.search_entry.bind("<KeyRelease>", lambda e: self._schedule_filter())
 
         # Table
         tree_container = ctk.CTkFrame(left_container)
@@ -373,7 +984,7 @@ class App(ctk.CTk):
         for col in columns:
             anchor = "center" if col != "Team" else "w"
             width = 60 if col != "Team" else 230
-            self.table_tree.heading(col, text=col, command=lambda c=col: self._sort_table(c))
+            self.table_tree.heading(col, text=col, command=functools.partial(self._sort_table, col))
             self.table_tree.column(col, width=width, anchor=anchor)
 
         self.table_tree.grid(row=0, column=0, sticky="nsew")
@@ -400,65 +1011,7 @@ class App(ctk.CTk):
         self.home_tab.columnconfigure(1, weight=1)
         self.home_tab.columnconfigure(2, weight=1)
 
-        self._continent_map.clear()
-        self._nation_key_map.clear()
-
-        folder_keys = list(sim.NATIONS_BY_CONTINENT.keys())
-        folder_slugs = {fk: self._slug(fk) for fk in folder_keys}
-
-        continent_rows = []
-        for c in sim.CONTINENTS:
-            name = c.get("continentName", "Unknown")
-            rep_val = c.get("reputation", c.get("continentReputation", 0))
-            c_slug = self._slug(name)
-            folder_match = None
-            for fk, fslug in folder_slugs.items():
-                if fslug == c_slug:
-                    folder_match = fk
-                    break
-            if folder_match is None:
-                continue
-            self._continent_map[name] = folder_match
-            continent_rows.append((rep_val or 0, name, folder_match))
-
-        continent_rows.sort(key=lambda x: x[0], reverse=True)
-
-        country_rows = []
-        for cont_folder, nations in sim.NATIONS_BY_CONTINENT.items():
-            for n in nations:
-                nid = n.get("nationId")
-                name = n.get("nationName", f"Nation {nid}")
-                rep_val = n.get("reputation", n.get("nationReputation", 0)) or 0
-                label = name
-                country_rows.append((rep_val, label, cont_folder, nid, n))
-                self._nation_key_map[(cont_folder, nid)] = n
-        country_rows.sort(key=lambda x: x[0], reverse=True)
-
-        comp_info = {}
-        for cont_folder, comps in sim.CONTINENT_LEVEL_COMPS.items():
-            for comp in comps:
-                cid = comp.get("compId")
-                cname = comp.get("compName", f"Comp {cid}")
-                rep_val = comp.get("reputation", comp.get("compReputation", 0)) or 0
-                if cid is None:
-                    continue
-                if cid not in comp_info or rep_val > comp_info[cid]["rep"]:
-                    comp_info[cid] = {"name": cname, "rep": rep_val}
-        
-        for comps in sim.NATION_COMPS.values():
-            for comp in comps:
-                cid = comp.get("compId")
-                cname = comp.get("compName", f"Comp {cid}")
-                rep_val = comp.get("reputation", comp.get("compReputation", 0)) or 0
-                if cid is None:
-                    continue
-                if cid not in comp_info or rep_val > comp_info[cid]["rep"]:
-                    comp_info[cid] = {"name": cname, "rep": rep_val}
-
-        comp_rows = []
-        for cid, info in comp_info.items():
-            comp_rows.append((info["rep"], info["name"], cid))
-        comp_rows.sort(key=lambda x: x[0], reverse=True)
+        continent_rows, country_rows, comp_rows = self._home_list_rows
 
         # Left: Continents
         left_frame = ctk.CTkFrame(self.home_tab)
@@ -469,16 +1022,10 @@ class App(ctk.CTk):
         ctk.CTkLabel(left_frame, text="Continents", font=ctk.CTkFont(size=16, weight="bold")).grid(
             row=0, column=0, sticky="w", padx=8, pady=(8, 4))
 
-        cont_list = ctk.CTkScrollableFrame(left_frame)
+        cont_list = VirtualButtonList(left_frame, command=self._open_continent_tab, button_height=32, spacing=6)
         cont_list.grid(row=1, column=0, sticky="nsew", padx=8, pady=4)
 
-        for rep_val, name, folder in continent_rows:
-            stars = self._to_stars(rep_val)
-            btn = ctk.CTkButton(
-                cont_list, text=f"{name}   {stars}",
-                command=lambda f=folder: self._open_continent_tab(f), height=32
-            )
-            btn.pack(fill="x", padx=4, pady=3)
+        cont_list.set_rows(continent_rows)
 
         # Middle: Countries
         mid_frame = ctk.CTkFrame(self.home_tab)
@@ -489,16 +1036,10 @@ class App(ctk.CTk):
         ctk.CTkLabel(mid_frame, text="Countries", font=ctk.CTkFont(size=16, weight="bold")).grid(
             row=0, column=0, sticky="w", padx=8, pady=(8, 4))
 
-        country_list = ctk.CTkScrollableFrame(mid_frame)
+        country_list = VirtualButtonList(mid_frame, command=self._open_country_key)
         country_list.grid(row=1, column=0, sticky="nsew", padx=8, pady=4)
 
-        for rep_val, label, cont_folder, nid, nobj in country_rows:
-            stars = self._to_stars(rep_val)
-            btn = ctk.CTkButton(
-                country_list, text=f"{label}   {stars}",
-                command=lambda cf=cont_folder, nnid=nid: self._open_country_tab(cf, nnid), height=30
-            )
-            btn.pack(fill="x", padx=4, pady=2)
+        country_list.set_rows(country_rows)
 
         # Right: Competitions
         right_frame = ctk.CTkFrame(self.home_tab)
@@ -509,16 +1050,10 @@ class App(ctk.CTk):
         ctk.CTkLabel(right_frame, text="Competitions", font=ctk.CTkFont(size=16, weight="bold")).grid(
             row=0, column=0, sticky="w", padx=8, pady=(8, 4))
 
-        comp_list = ctk.CTkScrollableFrame(right_frame)
+        comp_list = VirtualButtonList(right_frame, command=self._on_select_competition_from_home)
         comp_list.grid(row=1, column=0, sticky="nsew", padx=8, pady=4)
 
-        for rep_val, name, cid in comp_rows:
-            stars = self._to_stars(rep_val)
-            btn = ctk.CTkButton(
-                comp_list, text=f"{name}   {stars}",
-                command=lambda cc=cid: self._on_select_competition_from_home(cc), height=30
-            )
-            btn.pack(fill="x", padx=4, pady=2)
+        comp_list.set_rows(comp_rows)
 
     # ==================== Statistics Tab ====================
 
@@ -616,32 +1151,30 @@ class App(ctk.CTk):
         ).pack(pady=(20, 10))
 
         # Count titles
-        team_titles = {}
+        title_counts = Counter()
+        team_names = {}
         for season_data in sim.LEAGUE_HISTORY:
-            for comp_id, data in season_data.items():
-                table = data.get("table", [])
+            for data in season_data.values():
+                table = data.get("table")
                 if table:
                     winner_id = table[0].get("teamId")
-                    winner_name = table[0].get("teamName")
                     if winner_id:
-                        team_titles[winner_id] = team_titles.get(winner_id, {"name": winner_name, "count": 0})
-                        team_titles[winner_id]["count"] += 1
+                        title_counts[winner_id] += 1
+                        team_names.setdefault(winner_id, table[0].get("teamName"))
 
-        sorted_teams = sorted(team_titles.items(), key=lambda x: x[1]["count"], reverse=True)[:10]
-        
-        for tid, info in sorted_teams:
+        for tid, count in title_counts.most_common(10):
             frame = ctk.CTkFrame(scroll_frame)
             frame.pack(fill="x", pady=3, padx=20)
             
             ctk.CTkLabel(
                 frame,
-                text=f"{info['name']}:",
+                text=f"{team_names[tid]}:",
                 font=ctk.CTkFont(weight="bold")
             ).pack(side="left", padx=10)
             
             ctk.CTkLabel(
                 frame,
-                text=f"{info['count']} titles"
+                text=f"{count} titles"
             ).pack(side="left", padx=10)
             
             # Add button to view team
@@ -649,7 +1182,7 @@ class App(ctk.CTk):
                 frame,
                 text="View",
                 width=60,
-                command=lambda t=tid: self._open_team_tab(t)
+                command=functools.partial(self._open_team_tab, tid)
             )
             view_btn.pack(side="right", padx=10)
 
@@ -657,6 +1190,8 @@ class App(ctk.CTk):
 
     def _run_simulation(self):
         """Run simulation in separate thread with progress updates."""
+        if not self.world_loaded:
+            return
         if self.simulation_running:
             messagebox.showwarning("Simulation Running", "A simulation is already in progress")
             return
@@ -670,52 +1205,101 @@ class App(ctk.CTk):
 
         show_fixtures = self.fixtures_var.get()
 
-        # Show progress bar
-        self.progress_bar.grid()
+        # Reset progress bar
         self.progress_bar.set(0)
         self.simulation_running = True
 
-        # Run in thread
-        def simulate():
-            for i in range(seasons):
-                # Update progress
-                self.after(0, lambda: self.progress_label.configure(text=f"Season {i+1}/{seasons}"))
-                self.after(0, lambda: self.progress_bar.set((i+1) / seasons))
-
-                # Capture output
-                buf = io.StringIO()
-                with redirect_stdout(buf):
-                    sim.run_season(show_fixtures=show_fixtures, show_table=True, 
-                                 run_cups=True, run_continental=True)
-                text = buf.getvalue()
+        # Run in thread; output and progress come back through a queue
+        self._output_queue = queue.Queue()
+        thread = threading.Thread(
+            target=self._run_seasons_worker, args=(seasons, show_fixtures), daemon=True
+        )
+        thread.start()
+        self.after(50, self._pump_output)
 
-                # Update output box
-                season_header = f"\n{'='*24} SEASON {sim.CURRENT_SEASON} {'='*24}\n"
-                self.after(0, lambda t=season_header + text: self._append_output(t))
+    def _run_seasons_worker(self, seasons, show_fixtures):
+        """Simulate seasons on a worker thread, streaming stdout to the output queue."""
+        q = self._output_queue
+        writer = QueueWriter(q)
+        try:
+            with redirect_stdout(writer):
+                for i in range(seasons):
+                    q.put(("progress", (i + 1, seasons)))
+                    q.put(("text", f"\n{'='*24} SEASON {sim.CURRENT_SEASON + 1} {'='*24}\n"))
+                    sim.run_season(show_fixtures=show_fixtures, show_table=True,
+                                   run_cups=True, run_continental=True)
+                    q.put(("text", "\n"))
+        except Exception as e:
+            # Always end with a terminal message so the pump stops
+            q.put(("error", e))
+            return
+        # Aggregate titles here rather than on the Tk thread at first use;
+        # on failure the index is simply rebuilt lazily
+        try:
+            titles = (self._world_state(), self._build_titles_index())
+        except Exception:
+            titles = None
+        q.put(("done", titles))
+
+    def _pump_output(self):
+        """Drain queued simulation output into the output box."""
+        chunks = []
+        done = False
+        error = None
+        progress = None
+        try:
+            while True:
+                kind, payload = self._output_queue.get_nowait()
+                if kind == "text":
+                    chunks.append(payload)
+                elif kind == "progress":
+                    progress = payload
+                elif kind == "done":
+                    done = True
+                    self._prebuilt_titles = payload
+                    break
+                elif kind == "error":
+                    done = True
+                    error = payload
+                    break
+        except queue.Empty:
+            pass
 
-            # Simulation complete
-            self.after(0, self._simulation_complete)
+        if progress is not None:
+            current, total = progress
+            self.progress_label.configure(text=f"Season {current}/{total}")
+            self.progress_bar.set(current / total)
+        if chunks:
+            self._append_output("".join(chunks))
 
-        thread = threading.Thread(target=simulate, daemon=True)
-        thread.start()
+        if done:
+            self._simulation_complete(error)
+        else:
+            self.after(50, self._pump_output)
 
     def _append_output(self, text):
-        """Append text to output box (thread-safe)."""
+        """Append text to the output box."""
         self.output_box.configure(state="normal")
-        self.output_box.insert("end", text + "\n")
+        self.output_box.insert("end", text)
+        end_line = int(self.output_box.index("end-1c").split(".")[0])
+        if end_line > OUTPUT_MAX_LINES:
+            self.output_box.delete("1.0", f"{end_line - OUTPUT_MAX_LINES + 1}.0")
         self.output_box.see("end")
         self.output_box.configure(state="disabled")
 
-    def _simulation_complete(self):
-        """Called when simulation completes."""
+    def _simulation_complete(self, error=None):
+        """Called when simulation completes or the worker fails."""
         self.simulation_running = False
-        self.progress_bar.grid_remove()
+        self.progress_bar.set(0)
         self.progress_label.configure(text="")
 
-        # Refresh UI
-        self._refresh_all()
+        # Refresh UI; seasons finished before a failure are still shown
+        self._schedule_refresh()
 
-        messagebox.showinfo("Complete", "Simulation completed successfully!")
+        if error is not None:
+            messagebox.showerror("Simulation Error", f"Simulation failed:\n{error}")
+        else:
+            messagebox.showinfo("Complete", "Simulation completed successfully!")
 
     def _clear_output(self):
         """Clear output box."""
@@ -727,6 +1311,8 @@ class App(ctk.CTk):
 
     def _export_results(self):
         """Export season results to file."""
+        if not self.world_loaded:
+            return
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
@@ -739,44 +1325,41 @@ class App(ctk.CTk):
 
     def _import_results(self):
         """Import season results from file."""
+        if not self.world_loaded:
+            return
         filename = filedialog.askopenfilename(
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         
         if filename:
             if sim.import_season_results(filename):
-                self._refresh_all()
+                self._schedule_refresh()
                 messagebox.showinfo("Import", "Results imported successfully!")
             else:
                 messagebox.showerror("Import Error", "Failed to import results")
 
     # ==================== Refresh ====================
 
+    def _schedule_refresh(self):
+        """Coalesce refresh requests into one idle-time _refresh_all."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._refresh_all)
+
     def _refresh_all(self):
         """Refresh all UI elements after simulation."""
-        current_tab_id = self.notebook.select()
+        self._refresh_pending = False
+        if not self.world_loaded:
+            return
 
+        self._invalidate_caches()
         self._update_season_selector()
         self._populate_competitions()
-        self._update_table_for_competition()
-        self._build_home_tab()
-        self._build_stats_tab()
-
-        if self.current_continent_folder is not None:
-            self._open_continent_tab(self.current_continent_folder)
-
-        if (self.current_country_cont_folder is not None and
-                self.current_country_nation_id is not None):
-            self._open_country_tab(self.current_country_cont_folder,
-                                  self.current_country_nation_id)
-
-        if self.current_competition_id is not None:
-            self._open_competition_tab(self.current_competition_id)
-
-        if self.current_team_id is not None:
-            self._open_team_tab(self.current_team_id)
 
-        self.notebook.select(current_tab_id)
+        # Only the visible tab is rebuilt now; the rest catch up when shown
+        self._tab_dirty = dict.fromkeys(self._tab_dirty, True)
+        self._build_visible_tab()
 
     # ==================== Season/Competition Selectors ====================
 
@@ -805,14 +1388,11 @@ class App(ctk.CTk):
         return idx
 
     def _populate_competitions(self):
-        global comp_name_to_id
-        comp_name_to_id.clear()
-        names = []
-        for cid in sorted(sim.COMP_TEAMS.keys()):
-            if sim.COMP_FORMAT.get(cid) == 0:
-                name = sim.COMP_NAME_LOOKUP.get(cid, f"Competition {cid}")
-                comp_name_to_id[name] = cid
-                names.append(name)
+        names = self._league_names
+        # The list is rebuilt only by _build_nav_caches; skip re-applying it
+        if names is self._shown_league_names:
+            return
+        self._shown_league_names = names
         if not names:
             self.comp_select.configure(values=["No leagues"])
             self.comp_select.set("No leagues")
@@ -821,108 +1401,170 @@ class App(ctk.CTk):
             if self.comp_select.get() not in names:
                 self.comp_select.set(names[0])
 
+    def _schedule_table_update(self):
+        """Coalesce table refresh requests into one idle-time update."""
+        if self._pending_table_update:
+            return
+        self._pending_table_update = True
+        self.after_idle(self._do_table_update)
+
+    def _do_table_update(self):
+        """Run a scheduled table refresh, or defer it until the table is shown."""
+        self._pending_table_update = False
+        if self._tab_visible(self.league_tab):
+            self._update_table_for_competition()
+        else:
+            self._tab_dirty["league"] = True
+
     def _update_table_for_competition(self):
         """Update table view for selected competition."""
         name = self.comp_select.get()
-        if not name or name not in comp_name_to_id:
-            for row in self.table_tree.get_children():
-                self.table_tree.delete(row)
+        if not name or name not in self._comp_name_to_id:
+            self._table_source = None
+            self._set_table_rows([])
             return
 
         season_idx = self._get_selected_season_index()
         if season_idx is None:
-            for row in self.table_tree.get_children():
-                self.table_tree.delete(row)
+            self._table_source = None
+            self._set_table_rows([])
             return
 
         league_results = sim.LEAGUE_HISTORY[season_idx]
-        cid = comp_name_to_id[name]
+        cid = self._comp_name_to_id[name]
         if cid not in league_results:
-            for row in self.table_tree.get_children():
-                self.table_tree.delete(row)
+            self._table_source = None
+            self._set_table_rows([])
             return
 
+        # The same result dict is already on screen (possibly re-sorted)
         res = league_results[cid]
+        if res is self._table_source:
+            return
+        self._table_source = res
         table = res.get("table", [])
 
-        for row in self.table_tree.get_children():
-            self.table_tree.delete(row)
-
+        rows = []
         for pos, row in enumerate(table, start=1):
-            team_id = row.get("teamId")
-            values = (
+            rows.append((
                 pos, row["teamName"],
                 row.get("played", 0), row.get("wins", 0),
                 row.get("draws", 0), row.get("losses", 0),
                 row.get("gf", 0), row.get("ga", 0),
                 row.get("gd", 0), row.get("points", 0),
-            )
-            iid = str(team_id)
-            self.table_tree.insert("", "end", iid=iid, values=values)
+                row.get("teamId"),
+            ))
+        self._set_table_rows(rows)
+
+    def _set_table_rows(self, rows):
+        """Store typed standings rows and redraw the league table from them.
+
+        Each row holds the displayed column values followed by the team id,
+        so sorting and filtering can work on native ints instead of the
+        strings Tk hands back.
+        """
+        self._table_rows = rows
+        self._sorted_by = None
+        self._render_table_rows(rows)
+        self._table_lnames = {iid: values[1].lower()
+                              for iid, values in self._table_values.items()}
+        self._last_query = ""
+        if self.search_entry.get():
+            self._show_table_rows()
+
+    def _render_table_rows(self, rows):
+        """Bring the league table in line with rows, touching only what changed.
+
+        Items are keyed by team id. Rows whose values match what is already
+        shown are left alone, new teams are inserted, missing ones deleted,
+        and the final order is applied with a single set_children call.
+        """
+        tree = self.table_tree
+        n_cols = len(self.columns)
+        old_values = self._table_values
+        new_values = {}
+        iid_team = {}
+        # Silence scrollbar updates while the rows are swapped out
+        yscroll = tree.cget("yscrollcommand")
+        tree.configure(yscrollcommand="")
+        try:
+            for row in rows:
+                team_id = row[n_cols]
+                iid = f"t{team_id}"
+                values = row[:n_cols]
+                new_values[iid] = values
+                iid_team[iid] = team_id
+                old = old_values.get(iid)
+                if old is None:
+                    tree.insert("", "end", iid=iid, values=values)
+                elif old != values:
+                    tree.item(iid, values=values)
+            removed = [iid for iid in old_values if iid not in new_values]
+            if removed:
+                tree.delete(*removed)
+            tree.set_children("", *new_values)
+        finally:
+            tree.configure(yscrollcommand=yscroll)
+        self._table_values = new_values
+        self._iid_team = iid_team
+
+    def _schedule_filter(self):
+        """Restart the search delay so only the last keystroke filters."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(120, self._filter_table)
 
     def _filter_table(self):
         """Filter table based on search text."""
+        self._filter_after_id = None
+        self._show_table_rows()
+
+    def _show_table_rows(self):
+        """Attach the backing rows matching the search text, in backing order.
+
+        Filtering works on ``self._table_rows`` rather than the widget, so
+        rows detached by an earlier search come back when the text changes.
+        """
+        n_cols = len(self.columns)
         search_text = self.search_entry.get().lower()
-        
-        # Get all items
-        all_items = self.table_tree.get_children()
-        
-        if not search_text:
-            # Show all
-            for item in all_items:
-                self.table_tree.reattach(item, "", "end")
-        else:
-            # Filter
-            for item in all_items:
-                values = self.table_tree.item(item, "values")
-                team_name = values[1].lower() if len(values) > 1 else ""
-                if search_text in team_name:
-                    self.table_tree.reattach(item, "", "end")
-                else:
-                    self.table_tree.detach(item)
+        iids = [f"t{row[n_cols]}" for row in self._table_rows]
+        if search_text:
+            lnames = self._table_lnames
+            # A query containing the last one can only match a subset of it
+            last = self._last_query
+            candidates = self._last_matched if last and last in search_text else lnames
+            matched = {iid for iid in candidates if search_text in lnames[iid]}
+            iids = [iid for iid in iids if iid in matched]
+            self._last_matched = matched
+        self._last_query = search_text
+        self.table_tree.set_children("", *iids)
 
 # ==================== Table Operations ====================
 
     def _sort_table(self, column):
         """Sort table by column."""
-        items = list(self.table_tree.get_children())
-        if not items:
+        if not self._table_rows:
             return
 
-        col_index = self.columns.index(column)
-        ascending = sort_state.get(column, True)
-
-        def conv(val):
-            if column == "Team":
-                return val
-            try:
-                return int(val)
-            except ValueError:
-                try:
-                    return float(val)
-                except ValueError:
-                    return val
-
-        data = []
-        for iid in items:
-            vals = self.table_tree.item(iid, "values")
-            data.append((conv(vals[col_index]), iid, vals))
-
-        data.sort(key=lambda x: x[0], reverse=not ascending)
+        ascending = self._sort_state.get(column, True)
+        if column == self._sorted_by:
+            # Same column again: only the direction changes
+            self._table_rows.reverse()
+        else:
+            self._table_rows.sort(key=operator.itemgetter(self.columns.index(column)),
+                                  reverse=not ascending)
+            self._sorted_by = column
 
-        for index, (_, iid, _) in enumerate(data):
-            self.table_tree.move(iid, "", index)
+        # Reorder the existing items in one call; rows hidden by the search
+        # filter are left out so they stay detached.
+        self._show_table_rows()
 
-        sort_state[column] = not ascending
+        self._sort_state[column] = not ascending
 
     def _on_tree_double_click(self, event):
         """Handle double-click on team in table."""
-        item = self.table_tree.focus()
-        if not item:
-            return
-        try:
-            team_id = int(item)
-        except ValueError:
+        team_id = self._iid_team.get(self.table_tree.focus())
+        if team_id is None:
             return
         self.current_team_id = team_id
         self._open_team_tab(team_id)
@@ -933,6 +1575,7 @@ class App(ctk.CTk):
         """Placeholder for empty team tab."""
         for w in self.team_tab.winfo_children():
             w.destroy()
+        self.team_records_box = None
         self.team_tab.rowconfigure(0, weight=1)
         self.team_tab.columnconfigure(0, weight=1)
         placeholder = ctk.CTkLabel(
@@ -947,6 +1590,7 @@ class App(ctk.CTk):
         """Placeholder for empty competition tab."""
         for w in self.comp_detail_tab.winfo_children():
             w.destroy()
+        self.comp_table = None
         self.comp_detail_tab.rowconfigure(0, weight=1)
         self.comp_detail_tab.columnconfigure(0, weight=1)
         placeholder = ctk.CTkLabel(
@@ -960,42 +1604,47 @@ class App(ctk.CTk):
 # ==================== Navigation Methods ====================
 
     def _open_continent_tab(self, cont_folder):
-        """Open and populate continent tab."""
-        for w in self.continent_tab.winfo_children():
-            w.destroy()
-
+        """Open continent tab, building its view on first visit."""
         self.current_continent_folder = cont_folder
 
-        self.continent_tab.rowconfigure(1, weight=1)
+        view = self._continent_views.get(cont_folder)
+        if view is None:
+            view = self._build_continent_view(cont_folder)
+            self._continent_views[cont_folder] = view
+        view.tkraise()
+        self.notebook.select(self.continent_tab)
+
+    def _build_continent_view(self, cont_folder):
+        """Build the stacked continent layout for one continent folder."""
+        view = ctk.CTkFrame(self.continent_tab, fg_color="transparent")
+        view.grid(row=0, column=0, sticky="nsew")
+        self.continent_tab.rowconfigure(0, weight=1)
         self.continent_tab.columnconfigure(0, weight=1)
-        self.continent_tab.columnconfigure(1, weight=1)
-        self.continent_tab.columnconfigure(2, weight=1)
+
+        view.rowconfigure(1, weight=1)
+        view.columnconfigure(0, weight=1)
+        view.columnconfigure(1, weight=1)
+        view.columnconfigure(2, weight=1)
 
         # Find continent object
-        cont_obj = None
         cont_name = cont_folder.title()
         rep_val = 0
-        folder_slug = self._slug(cont_folder)
-        for c in sim.CONTINENTS:
-            name = c.get("continentName", "Unknown")
-            slug = self._slug(name)
-            if slug == folder_slug:
-                cont_obj = c
-                cont_name = name
-                rep_val = c.get("reputation", c.get("continentReputation", 0)) or 0
-                break
+        cont_obj = self._cont_obj_by_folder.get(cont_folder)
+        if cont_obj is not None:
+            cont_name = cont_obj.get("continentName", "Unknown")
+            rep_val = cont_obj.get("reputation", cont_obj.get("continentReputation", 0)) or 0
 
         stars = self._to_stars(rep_val)
 
         top_label = ctk.CTkLabel(
-            self.continent_tab,
+            view,
             text=f"{cont_name}   {stars}",
             font=ctk.CTkFont(size=20, weight="bold")
         )
         top_label.grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
 
         # Countries
-        countries_frame = ctk.CTkFrame(self.continent_tab)
+        countries_frame = ctk.CTkFrame(view)
         countries_frame.grid(row=1, column=0, sticky="nsew", padx=(10, 5), pady=10)
         countries_frame.rowconfigure(1, weight=1)
         countries_frame.columnconfigure(0, weight=1)
@@ -1006,30 +1655,18 @@ class App(ctk.CTk):
             font=ctk.CTkFont(size=14, weight="bold")
         ).grid(row=0, column=0, sticky="w", padx=6, pady=(6, 4))
 
-        c_list = ctk.CTkScrollableFrame(countries_frame)
+        c_list = VirtualButtonList(countries_frame, command=self._open_country_key)
         c_list.grid(row=1, column=0, sticky="nsew", padx=6, pady=4)
 
-        nations = sim.NATIONS_BY_CONTINENT.get(cont_folder, [])
-        country_rows = []
-        for n in nations:
-            nid = n.get("nationId")
-            name = n.get("nationName", f"Nation {nid}")
-            rep_val = n.get("reputation", n.get("nationReputation", 0)) or 0
-            country_rows.append((rep_val, name, nid, n))
-        country_rows.sort(key=lambda x: x[0], reverse=True)
-
+        country_rows = self._countries_by_continent.get(cont_folder, [])
+        rows = []
         for rep_val, name, nid, nobj in country_rows:
             stars = self._to_stars(rep_val)
-            btn = ctk.CTkButton(
-                c_list,
-                text=f"{name}   {stars}",
-                command=lambda nf=cont_folder, nid2=nid: self._open_country_tab(nf, nid2),
-                height=30
-            )
-            btn.pack(fill="x", padx=4, pady=2)
+            rows.append((f"{name}   {stars}", (cont_folder, nid)))
+        c_list.set_rows(rows)
 
         # Domestic competitions
-        dom_frame = ctk.CTkFrame(self.continent_tab)
+        dom_frame = ctk.CTkFrame(view)
         dom_frame.grid(row=1, column=1, sticky="nsew", padx=5, pady=10)
         dom_frame.rowconfigure(1, weight=1)
         dom_frame.columnconfigure(0, weight=1)
@@ -1040,36 +1677,18 @@ class App(ctk.CTk):
             font=ctk.CTkFont(size=14, weight="bold")
         ).grid(row=0, column=0, sticky="w", padx=6, pady=(6, 4))
 
-        dom_list = ctk.CTkScrollableFrame(dom_frame)
+        dom_list = VirtualButtonList(dom_frame, command=self._open_competition_tab)
         dom_list.grid(row=1, column=0, sticky="nsew", padx=6, pady=4)
 
-        dom_rows = []
-        for (cf, nid), folder in sim.NATION_FOLDERS.items():
-            if cf != cont_folder:
-                continue
-            nation_path = os.path.join(sim.DATA_DIR, cf, folder)
-            comps = sim.NATION_COMPS.get(nation_path, [])
-            for comp in comps:
-                cid = comp.get("compId")
-                cname = comp.get("compName", f"Comp {cid}")
-                rep_val = comp.get("reputation", comp.get("compReputation", 0)) or 0
-                if cid is None:
-                    continue
-                dom_rows.append((rep_val, cname, cid))
-        dom_rows.sort(key=lambda x: x[0], reverse=True)
-
+        dom_rows = self._comps_by_continent_domestic.get(cont_folder, [])
+        rows = []
         for rep_val, cname, cid in dom_rows:
             stars = self._to_stars(rep_val)
-            btn = ctk.CTkButton(
-                dom_list,
-                text=f"{cname}   {stars}",
-                command=lambda cc=cid: self._open_competition_tab(cc),
-                height=30
-            )
-            btn.pack(fill="x", padx=4, pady=2)
+            rows.append((f"{cname}   {stars}", cid))
+        dom_list.set_rows(rows)
 
         # Continental competitions
-        contc_frame = ctk.CTkFrame(self.continent_tab)
+        contc_frame = ctk.CTkFrame(view)
         contc_frame.grid(row=1, column=2, sticky="nsew", padx=(5, 10), pady=10)
         contc_frame.rowconfigure(1, weight=1)
         contc_frame.columnconfigure(0, weight=1)
@@ -1080,68 +1699,65 @@ class App(ctk.CTk):
             font=ctk.CTkFont(size=14, weight="bold")
         ).grid(row=0, column=0, sticky="w", padx=6, pady=(6, 4))
 
-        contc_list = ctk.CTkScrollableFrame(contc_frame)
+        contc_list = VirtualButtonList(contc_frame, command=self._open_competition_tab)
         contc_list.grid(row=1, column=0, sticky="nsew", padx=6, pady=4)
 
-        contc_rows = []
-        for comp in sim.CONTINENT_LEVEL_COMPS.get(cont_folder, []):
-            # Only show true continental tournaments (format 5)
-            if comp.get("format") != 5:
-                continue
-            cid = comp.get("compId")
-            cname = comp.get("compName", f"Comp {cid}")
-            rep_val = comp.get("reputation", comp.get("compReputation", 0)) or 0
-            if cid is None:
-                continue
-            contc_rows.append((rep_val, cname, cid))
-        contc_rows.sort(key=lambda x: x[0], reverse=True)
-
+        contc_rows = self._comps_continental.get(cont_folder, [])
+        rows = []
         for rep_val, cname, cid in contc_rows:
             stars = self._to_stars(rep_val)
-            btn = ctk.CTkButton(
-                contc_list,
-                text=f"{cname}   {stars}",
-                command=lambda cc=cid: self._open_competition_tab(cc),
-                height=30
-            )
-            btn.pack(fill="x", padx=4, pady=2)
+            rows.append((f"{cname}   {stars}", cid))
+        contc_list.set_rows(rows)
 
-        self.notebook.select(self.continent_tab)
+        return view
 
-    def _open_country_tab(self, cont_folder, nation_id):
-        """Open and populate country tab."""
-        for w in self.country_tab.winfo_children():
-            w.destroy()
+    def _open_country_key(self, key):
+        """Open a country tab from a (cont_folder, nation_id) key."""
+        self._open_country_tab(*key)
 
+    def _open_country_tab(self, cont_folder, nation_id):
+        """Open country tab, building its view on first visit."""
         self.current_country_cont_folder = cont_folder
         self.current_country_nation_id = nation_id
+        self._show_country_view(cont_folder, nation_id)
+        self.notebook.select(self.country_tab)
 
-        self.country_tab.rowconfigure(2, weight=1)
+    def _show_country_view(self, cont_folder, nation_id):
+        """Raise the cached view for a nation, building it if needed."""
+        key = (cont_folder, nation_id)
+        view = self._country_views.get(key)
+        if view is None:
+            view = self._build_country_view(cont_folder, nation_id)
+            self._country_views[key] = view
+        view.tkraise()
+
+    def _build_country_view(self, cont_folder, nation_id):
+        """Build the stacked country layout for one nation."""
+        view = ctk.CTkFrame(self.country_tab, fg_color="transparent")
+        view.grid(row=0, column=0, sticky="nsew")
+        self.country_tab.rowconfigure(0, weight=1)
         self.country_tab.columnconfigure(0, weight=1)
-        self.country_tab.columnconfigure(1, weight=1)
 
-        nations = sim.NATIONS_BY_CONTINENT.get(cont_folder, [])
-        nobj = None
-        for n in nations:
-            if n.get("nationId") == nation_id:
-                nobj = n
-                break
+        view.rowconfigure(2, weight=1)
+        view.columnconfigure(0, weight=1)
+        view.columnconfigure(1, weight=1)
+
+        nobj = self._nation_key_map.get((cont_folder, nation_id))
 
         if nobj is None:
             label = ctk.CTkLabel(
-                self.country_tab,
+                view,
                 text="Country not found.",
                 font=ctk.CTkFont(size=16, weight="bold")
             )
             label.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-            self.notebook.select(self.country_tab)
-            return
+            return view
 
         name = nobj.get("nationName", f"Nation {nation_id}")
         rep_val = nobj.get("reputation", nobj.get("nationReputation", 0)) or 0
         rep_stars = self._to_stars(rep_val)
 
-        top_frame = ctk.CTkFrame(self.country_tab, fg_color="transparent")
+        top_frame = ctk.CTkFrame(view, fg_color="transparent")
         top_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 5))
         top_frame.grid_columnconfigure(0, weight=1)
         top_frame.grid_columnconfigure(1, weight=1)
@@ -1154,7 +1770,7 @@ class App(ctk.CTk):
         name_label.grid(row=0, column=0, sticky="w", padx=5, pady=(0, 2))
 
         # National team section
-        nt_frame = ctk.CTkFrame(self.country_tab)
+        nt_frame = ctk.CTkFrame(view)
         nt_frame.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(0, 5))
         for i in range(4):
             nt_frame.grid_columnconfigure(i, weight=1)
@@ -1164,10 +1780,10 @@ class App(ctk.CTk):
         )
 
         # Try to read some generic rating fields if present
-        nt_attack = nobj.get("ntAttack", nobj.get("attack", None))
-        nt_mid = nobj.get("ntMidfield", nobj.get("midfield", None))
-        nt_def = nobj.get("ntDefense", nobj.get("defense", None))
-        nt_gk = nobj.get("ntGoalkeeping", nobj.get("goalkeeping", None))
+        nt_attack = self._pick(nobj, "ntAttack", "attack")
+        nt_mid = self._pick(nobj, "ntMidfield", "midfield")
+        nt_def = self._pick(nobj, "ntDefense", "defense")
+        nt_gk = self._pick(nobj, "ntGoalkeeping", "goalkeeping")
 
         if any(v is not None for v in [nt_attack, nt_mid, nt_def, nt_gk]):
             if nt_attack is not None:
@@ -1193,7 +1809,7 @@ class App(ctk.CTk):
             ).grid(row=1, column=0, columnspan=4, padx=5, pady=2, sticky="w")
 
         # Lower area: left = domestic competitions, right = clubs
-        lower_frame = ctk.CTkFrame(self.country_tab)
+        lower_frame = ctk.CTkFrame(view)
         lower_frame.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=10, pady=(5, 10))
         lower_frame.rowconfigure(0, weight=1)
         lower_frame.columnconfigure(0, weight=1)
@@ -1208,33 +1824,15 @@ class App(ctk.CTk):
         ctk.CTkLabel(dom_frame, text="Domestic competitions").grid(
             row=0, column=0, sticky="w", padx=5, pady=(5, 0)
         )
-        dom_list = ctk.CTkScrollableFrame(dom_frame)
+        dom_list = VirtualButtonList(dom_frame, command=self._open_competition_tab)
         dom_list.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
 
-        dom_rows = []
-        for (cf, nid), folder in sim.NATION_FOLDERS.items():
-            if cf != cont_folder or nid != nation_id:
-                continue
-            nation_path = os.path.join(sim.DATA_DIR, cf, folder)
-            comps = sim.NATION_COMPS.get(nation_path, [])
-            for comp in comps:
-                cid = comp.get("compId")
-                cname = comp.get("compName", f"Comp {cid}")
-                rep_val = comp.get("reputation", comp.get("compReputation", 0)) or 0
-                if cid is None:
-                    continue
-                dom_rows.append((rep_val, cname, cid))
-        dom_rows.sort(key=lambda x: x[0], reverse=True)
-
+        dom_rows = self._comps_by_nation.get((cont_folder, nation_id), [])
+        rows = []
         for rep_val, cname, cid in dom_rows:
             stars = self._to_stars(rep_val)
-            btn = ctk.CTkButton(
-                dom_list,
-                text=f"{cname}   {stars}",
-                command=lambda cc=cid: self._open_competition_tab(cc),
-                height=30
-            )
-            btn.pack(fill="x", padx=4, pady=2)
+            rows.append((f"{cname}   {stars}", cid))
+        dom_list.set_rows(rows)
 
         # Clubs list in that country (by reputation)
         clubs_frame = ctk.CTkFrame(lower_frame)
@@ -1245,27 +1843,11 @@ class App(ctk.CTk):
         ctk.CTkLabel(clubs_frame, text="Clubs in this country").grid(
             row=0, column=0, sticky="w", padx=5, pady=(5, 0)
         )
-        clubs_list = ctk.CTkScrollableFrame(clubs_frame)
+        clubs_list = VirtualButtonList(clubs_frame, command=self._open_team_tab, button_height=28)
         clubs_list.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
 
-        # Collect unique clubs based on teamNationId
-        clubs_map = {}
-        for teams in sim.COMP_TEAMS.values():
-            for t in teams:
-                if t.get("teamNationId") != nation_id:
-                    continue
-                tid = t.get("teamId")
-                if tid is None:
-                    continue
-                if tid not in clubs_map:
-                    clubs_map[tid] = t
-
-        clubs_rows = []
-        for tid, t in clubs_map.items():
-            rep = t.get("reputationFactor", 0)
-            clubs_rows.append((rep, tid, t))
-        clubs_rows.sort(key=lambda x: x[0], reverse=True)
-
+        clubs_rows = self._clubs_by_nation.get(nation_id, [])
+        rows = []
         for rep, tid, t in clubs_rows:
             stars = self._to_stars(rep)
             name = t.get("teamName", f"Team {tid}")
@@ -1273,26 +1855,15 @@ class App(ctk.CTk):
             # Add bookmark indicator
             bookmark_indicator = " ★" if tid in bookmarked_teams else ""
             
-            btn = ctk.CTkButton(
-                clubs_list,
-                text=f"{name}{bookmark_indicator}   {stars}",
-                command=lambda team_id=tid: self._open_team_tab(team_id),
-                height=28
-            )
-            btn.pack(fill="x", padx=4, pady=2)
+            rows.append((f"{name}{bookmark_indicator}   {stars}", tid))
+        clubs_list.set_rows(rows)
 
-        self.notebook.select(self.country_tab)
+        return view
 
-    def _open_competition_tab(self, comp_id):
-        """Open and populate competition detail tab."""
+    def _build_competition_tab_skeleton(self):
+        """Build the competition tab widgets once; _open_competition_tab fills them."""
         for w in self.comp_detail_tab.winfo_children():
             w.destroy()
-        self._comp_logo_image = None
-
-        self.current_competition_id = comp_id
-
-        comp_name = sim.COMP_NAME_LOOKUP.get(comp_id, f"Competition {comp_id}")
-        self._load_comp_logo_image(comp_id, size=(72, 72))
 
         self.comp_detail_tab.rowconfigure(2, weight=1)
         self.comp_detail_tab.columnconfigure(0, weight=1)
@@ -1302,16 +1873,15 @@ class App(ctk.CTk):
         top_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 5))
         top_frame.grid_columnconfigure(1, weight=1)
 
-        if self._comp_logo_image is not None:
-            logo_label = ctk.CTkLabel(top_frame, image=self._comp_logo_image, text="")
-            logo_label.grid(row=0, column=0, rowspan=2, padx=(0, 10), pady=0, sticky="w")
+        self.comp_logo_label = ctk.CTkLabel(top_frame, text="")
+        self.comp_logo_label.grid(row=0, column=0, rowspan=2, padx=(0, 10), pady=0, sticky="w")
 
-        name_label = ctk.CTkLabel(
+        self.comp_name_label = ctk.CTkLabel(
             top_frame,
-            text=comp_name,
+            text="",
             font=ctk.CTkFont(size=20, weight="bold")
         )
-        name_label.grid(row=0, column=1, sticky="w", padx=5, pady=(0, 2))
+        self.comp_name_label.grid(row=0, column=1, sticky="w", padx=5, pady=(0, 2))
 
         middle_frame = ctk.CTkFrame(self.comp_detail_tab)
         middle_frame.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(0, 5))
@@ -1335,8 +1905,8 @@ class App(ctk.CTk):
         bottom_frame.columnconfigure(1, weight=1)
         bottom_frame.columnconfigure(2, weight=1)
 
-        winners_box = ctk.CTkTextbox(bottom_frame, wrap="word")
-        winners_box.grid(row=0, column=0, sticky="nsew", padx=(5, 5), pady=5)
+        self.comp_winners_box = ctk.CTkTextbox(bottom_frame, wrap="word")
+        self.comp_winners_box.grid(row=0, column=0, sticky="nsew", padx=(5, 5), pady=5)
 
         table_frame = ctk.CTkFrame(bottom_frame)
         table_frame.grid(row=0, column=1, sticky="nsew", padx=(5, 5), pady=5)
@@ -1358,9 +1928,38 @@ class App(ctk.CTk):
         comp_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=comp_table.yview)
         comp_scroll.grid(row=0, column=1, sticky="ns")
         comp_table.configure(yscrollcommand=comp_scroll.set)
+        self.comp_table = comp_table
+
+        self.comp_rep_box = ctk.CTkTextbox(bottom_frame, wrap="word")
+        self.comp_rep_box.grid(row=0, column=2, sticky="nsew", padx=(5, 5), pady=5)
+
+    def _open_competition_tab(self, comp_id):
+        """Open and populate competition detail tab."""
+        self.current_competition_id = comp_id
+
+        # Skip the rebuild when no season has been added since the last one
+        sig = (comp_id, len(sim.LEAGUE_HISTORY), len(sim.CUP_HISTORY))
+        if sig == self._comp_tab_sig:
+            self.notebook.select(self.comp_detail_tab)
+            return
+
+        if self.comp_table is None:
+            self._build_competition_tab_skeleton()
+        self._comp_tab_sig = sig
+
+        comp_name = sim.COMP_NAME_LOOKUP.get(comp_id, f"Competition {comp_id}")
+        self._load_comp_logo_image(comp_id, size=(72, 72))
 
-        rep_box = ctk.CTkTextbox(bottom_frame, wrap="word")
-        rep_box.grid(row=0, column=2, sticky="nsew", padx=(5, 5), pady=5)
+        if self._comp_logo_image is not None:
+            self.comp_logo_label.configure(image=self._comp_logo_image)
+            self.comp_logo_label.grid()
+        else:
+            self.comp_logo_label.grid_remove()
+        self.comp_name_label.configure(text=comp_name)
+
+        winners_box = self.comp_winners_box
+        comp_table = self.comp_table
+        rep_box = self.comp_rep_box
 
         winners_box.configure(state="normal")
         winners_box.delete("1.0", "end")
@@ -1368,31 +1967,15 @@ class App(ctk.CTk):
         rep_box.configure(state="normal")
         rep_box.delete("1.0", "end")
 
-        league_hist = getattr(sim, "LEAGUE_HISTORY", [])
-        cup_hist = getattr(sim, "CUP_HISTORY", [])
+        children = comp_table.get_children()
+        if children:
+            comp_table.delete(*children)
 
-        winners = []
-        for season_index, season_res in enumerate(league_hist, start=1):
-            res = season_res.get(comp_id)
-            if not res:
-                continue
-            table = res.get("table", [])
-            if not table:
-                continue
-            winners.append((season_index, table[0].get("teamName", "Unknown")))
+        league_hist = sim.LEAGUE_HISTORY
 
-        for season_index, season_res in enumerate(cup_hist, start=1):
-            res = season_res.get(comp_id)
-            if not res:
-                continue
-            winner_name = res.get("winner")
-            if winner_name:
-                winners.append((season_index, winner_name))
-
-        winners.sort(key=lambda x: x[0])
+        winners = self._competition_winners(comp_id)
         if winners:
-            for s, name in winners:
-                winners_box.insert("end", f"Season {s}: {name}\n")
+            winners_box.insert("end", "".join(f"Season {s}: {name}\n" for s, name in winners))
         else:
             winners_box.insert("end", "No winners recorded yet.\n")
         winners_box.configure(state="disabled")
@@ -1420,52 +2003,103 @@ class App(ctk.CTk):
                         ),
                     )
 
-        rep_box.insert("end", "Teams by reputation:\n")
-        teams = sim.COMP_TEAMS.get(comp_id, [])
-        teams_sorted_rep = sorted(teams, key=lambda t: t.get("reputationFactor", 0), reverse=True)
-        for t in teams_sorted_rep:
-            rep_stars = self._to_stars(t.get("reputationFactor", 0))
-            fin_stars = self._to_stars(t.get("financial", 0))
-            rep_box.insert(
-                "end",
-                f"  {t.get('teamName','')}: rep {rep_stars}, fin {fin_stars}\n"
-            )
-
-        rep_box.insert("end", "\nTeams by titles in this competition:\n")
-        title_counts = []
-        for tid, hist in sim.TEAM_HISTORY.items():
-            base = sim.TEAM_ID_MAP.get(tid, {})
-            trophies = base.get("trophies", {})
-            base_count = 0
-            if isinstance(trophies, dict):
-                base_count = int(trophies.get(str(comp_id), 0))
-            extra = 0
-            for r in hist.get("records", []):
-                if r.get("compId") != comp_id:
-                    continue
-                if r.get("type") == "league" and r.get("position") == 1:
-                    extra += 1
-                elif r.get("type") == "cup" and r.get("winner"):
-                    extra += 1
-            total = base_count + extra
-            if total > 0:
-                title_counts.append((hist.get("name", f"Team {tid}"), total))
-        title_counts.sort(key=lambda x: x[1], reverse=True)
+        lines = ["Teams by reputation:\n"]
+        lines.extend(self._teams_by_rep_lines(comp_id))
+
+        lines.append("\nTeams by titles in this competition:\n")
+        if self._titles_index is None:
+            self._titles_index = self._build_titles_index()
+        title_counts = [
+            (sim.TEAM_HISTORY[tid].get("name", f"Team {tid}"), total)
+            for tid, total in self._titles_index.get(comp_id, {}).items()
+            if total > 0
+        ]
+        title_counts.sort(key=operator.itemgetter(1), reverse=True)
         if title_counts:
-            for name, cnt in title_counts:
-                rep_box.insert("end", f"  {name}: {cnt}\n")
+            lines.extend(f"  {name}: {cnt}\n" for name, cnt in title_counts)
         else:
-            rep_box.insert("end", "  No titles recorded yet.\n")
+            lines.append("  No titles recorded yet.\n")
 
+        rep_box.insert("end", "".join(lines))
         rep_box.configure(state="disabled")
         self.notebook.select(self.comp_detail_tab)
 
+    def _teams_by_rep_lines(self, comp_id):
+        """Return the competition's teams-by-reputation lines, cached per world state."""
+        rep_lines = self._comp_rep_lines.get(comp_id)
+        if rep_lines is None:
+            teams = sim.COMP_TEAMS.get(comp_id, [])
+            teams_sorted_rep = sorted(teams, key=lambda t: t.get("reputationFactor", 0), reverse=True)
+            to_stars = self._to_stars
+            rep_lines = [
+                f"  {t.get('teamName','')}: rep {to_stars(t.get('reputationFactor', 0))}, "
+                f"fin {to_stars(t.get('financial', 0))}\n"
+                for t in teams_sorted_rep
+            ]
+            self._comp_rep_lines[comp_id] = rep_lines
+        return rep_lines
+
+    def _competition_winners(self, comp_id):
+        """Return (season, winner name) pairs for a competition in season order.
+
+        The index is extended with only the seasons added since the last
+        call, and rebuilt from scratch when the history lists are replaced
+        (e.g. by an import).
+        """
+        league_hist = sim.LEAGUE_HISTORY
+        cup_hist = sim.CUP_HISTORY
+        index = self._winners_index
+        src_league, src_cup = self._winners_source
+        if src_league is not league_hist or src_cup is not cup_hist:
+            index.clear()
+            self._winners_source = (league_hist, cup_hist)
+            self._winners_seen = (0, 0)
+        seen_league, seen_cup = self._winners_seen
+
+        for season_index in range(seen_league, len(league_hist)):
+            for cid, res in league_hist[season_index].items():
+                table = res.get("table") if res else None
+                if table:
+                    index.setdefault(cid, []).append(
+                        (season_index + 1, table[0].get("teamName", "Unknown")))
+
+        for season_index in range(seen_cup, len(cup_hist)):
+            for cid, res in cup_hist[season_index].items():
+                winner_name = res.get("winner") if res else None
+                if winner_name:
+                    index.setdefault(cid, []).append((season_index + 1, winner_name))
+
+        self._winners_seen = (len(league_hist), len(cup_hist))
+        return index.get(comp_id, [])
+
+    def _build_titles_index(self):
+        """Count titles per competition and team in one pass over TEAM_HISTORY."""
+        index = {}
+        for tid, hist in sim.TEAM_HISTORY.items():
+            trophies = sim.TEAM_ID_MAP.get(tid, {}).get("trophies", {})
+            if isinstance(trophies, dict):
+                for cid_str, cnt in trophies.items():
+                    try:
+                        cid = int(cid_str)
+                        c = int(cnt)
+                    except (ValueError, TypeError):
+                        continue
+                    per_team = index.setdefault(cid, {})
+                    per_team[tid] = per_team.get(tid, 0) + c
+            for r in hist.get("records", []):
+                rtype = r.get("type")
+                if ((rtype == "league" and r.get("position") == 1) or
+                        (rtype == "cup" and r.get("winner"))):
+                    per_team = index.setdefault(r.get("compId"), {})
+                    per_team[tid] = per_team.get(tid, 0) + 1
+        return index
+
     def _open_selected_competition(self):
         """Open currently selected competition from dropdown."""
         name = self.comp_select.get()
-        if not name or name not in comp_name_to_id:
+        if not name or name not in self._comp_name_to_id:
             return
-        cid = comp_name_to_id[name]
+        cid = self._comp_name_to_id[name]
         self._open_competition_tab(cid)
 
     def _on_select_competition_from_home(self, comp_id):
@@ -1477,14 +2111,19 @@ class App(ctk.CTk):
 
         self.current_competition_id = comp_id
 
-        self._update_table_for_competition()
+        self._schedule_table_update()
         self.notebook.select(self.league_tab)
 
     # ==================== Helper Methods ====================
 
     def _compute_trophies(self, team_id, team_obj, info):
-        """Compute trophy count for a team."""
-        trophies = {}
+        """Compute trophy count for a team (cached per history length)."""
+        key = (team_id, len(info.get("records", [])))
+        cached = self._trophies_cache.get(key)
+        if cached is not None:
+            return cached
+
+        trophies = Counter()
 
         base = team_obj.get("trophies", {})
         if isinstance(base, dict):
@@ -1494,39 +2133,51 @@ class App(ctk.CTk):
                     c = int(count)
                 except (ValueError, TypeError):
                     continue
-                trophies[cid] = trophies.get(cid, 0) + c
+                trophies[cid] += c
 
-        records = info.get("records", [])
-        for r in records:
-            t = r.get("type")
+        by_type = self._records_by_type(team_id, info)
+        for r in by_type.get("league", []):
             cid = r.get("compId")
-            if cid is None:
-                continue
-            if t == "league":
-                if r.get("position") == 1:
-                    trophies[cid] = trophies.get(cid, 0) + 1
-            elif t == "cup":
-                if r.get("winner"):
-                    trophies[cid] = trophies.get(cid, 0) + 1
-            elif t == "continental":
-                if r.get("winner"):
-                    trophies[cid] = trophies.get(cid, 0) + 1
-
+            if cid is not None and r.get("position") == 1:
+                trophies[cid] += 1
+        for rtype in ("cup", "continental"):
+            for r in by_type.get(rtype, []):
+                cid = r.get("compId")
+                if cid is not None and r.get("winner"):
+                    trophies[cid] += 1
+
+        self._trophies_cache[key] = trophies
         return trophies
 
-    def _league_positions_by_season(self, info):
-        """Get league positions by season for a team."""
-        positions_by_season = {}
+    def _records_by_type(self, team_id, info):
+        """Group a team's history records by type (cached per history length)."""
         records = info.get("records", [])
-        for r in records:
-            if r.get("type") != "league":
-                continue
+        key = (team_id, len(records))
+        cached = self._records_index.get(key)
+        if cached is None:
+            cached = {}
+            for r in records:
+                cached.setdefault(r.get("type"), []).append(r)
+            self._records_index[key] = cached
+        return cached
+
+    def _league_positions_by_season(self, team_id, info):
+        """Get league positions by season for a team (cached per history length)."""
+        records = info.get("records", [])
+        key = (team_id, len(records))
+        cached = self._positions_cache.get(key)
+        if cached is not None:
+            return cached
+
+        positions_by_season = {}
+        tier_get = sim.COMP_TIER.get
+        for r in self._records_by_type(team_id, info).get("league", []):
             season = r.get("season")
             comp_id = r.get("compId")
             pos = r.get("position")
             if season is None or comp_id is None or pos is None:
                 continue
-            tier = sim.COMP_TIER.get(comp_id, 99)
+            tier = tier_get(comp_id, 99)
             existing = positions_by_season.get(season)
             if existing is None or tier < existing["tier"]:
                 positions_by_season[season] = {
@@ -1534,62 +2185,36 @@ class App(ctk.CTk):
                     "position": pos,
                     "compId": comp_id
                 }
+        self._positions_cache[key] = positions_by_season
         return positions_by_season
 
     # ==================== Asset Loading ====================
 
     def _load_logo_image(self, team_id, size=(64, 64)):
         """Load team logo image."""
-        self._team_logo_image = None
-        try:
-            path = os.path.join(sim.DATA_DIR, "europe", "germany", "logos", f"{team_id}.png")
-            if os.path.exists(path):
-                img = Image.open(path)
-                self._team_logo_image = ctk.CTkImage(light_image=img, dark_image=img, size=size)
-        except Exception:
-            self._team_logo_image = None
+        path = os.path.join(_TEAM_LOGO_DIR, f"{team_id}.png")
+        self._team_logo_image = _load_image(path, *size)
 
     def _load_comp_logo_image(self, comp_id, size=(72, 72)):
         """Load competition logo image."""
-        self._comp_logo_image = None
-        try:
-            path = os.path.join(sim.DATA_DIR, "europe", "germany", "leaguelogos", f"{comp_id}.png")
-            if os.path.exists(path):
-                img = Image.open(path)
-                self._comp_logo_image = ctk.CTkImage(light_image=img, dark_image=img, size=size)
-        except Exception:
-            self._comp_logo_image = None
+        path = os.path.join(_COMP_LOGO_DIR, f"{comp_id}.png")
+        self._comp_logo_image = _load_image(path, *size)
 
     def _load_trophy_image(self, comp_id, size=(32, 32)):
         """Load trophy image for competition."""
-        try:
-            path = os.path.join(sim.DATA_DIR, "europe", "germany", "trophies", f"{comp_id}.png")
-            if os.path.exists(path):
-                img = Image.open(path)
-                ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=size)
-                self._trophy_images.append(ctk_img)
-                return ctk_img
-        except Exception:
-            return None
-        return None
+        path = os.path.join(_TROPHY_DIR, f"{comp_id}.png")
+        ctk_img = _load_image(path, *size)
+        if ctk_img is not None:
+            self._trophy_images.append(ctk_img)
+        return ctk_img
 
 # ==================== Team Tab ====================
 
-    def _open_team_tab(self, team_id):
-        """Open and populate team detail tab."""
+    def _build_team_tab_skeleton(self):
+        """Build the team tab widgets once; _open_team_tab fills them."""
         for w in self.team_tab.winfo_children():
             w.destroy()
 
-        info = sim.TEAM_HISTORY.get(team_id)
-        team_obj = sim.TEAM_ID_MAP.get(team_id)
-        if info is None or team_obj is None:
-            self._build_empty_team_tab()
-            self.notebook.select(self.team_tab)
-            return
-
-        self.current_team_id = team_id
-        self._trophy_images = []
-
         self.team_tab.rowconfigure(2, weight=1)
         self.team_tab.columnconfigure(0, weight=1)
 
@@ -1597,73 +2222,36 @@ class App(ctk.CTk):
         top_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
         top_frame.grid_columnconfigure(1, weight=1)
 
-        self._load_logo_image(team_id, size=(64, 64))
-        if self._team_logo_image is not None:
-            logo_label = ctk.CTkLabel(top_frame, image=self._team_logo_image, text="")
-            logo_label.grid(row=0, column=0, rowspan=2, padx=(0, 10), pady=0, sticky="w")
+        self.team_logo_label = ctk.CTkLabel(top_frame, text="")
+        self.team_logo_label.grid(row=0, column=0, rowspan=2, padx=(0, 10), pady=0, sticky="w")
 
-        name_label = ctk.CTkLabel(
+        self.team_name_label = ctk.CTkLabel(
             top_frame,
-            text=info.get("name", ""),
+            text="",
             font=ctk.CTkFont(size=20, weight="bold")
         )
-        name_label.grid(row=0, column=1, sticky="w", padx=5, pady=(0, 2))
+        self.team_name_label.grid(row=0, column=1, sticky="w", padx=5, pady=(0, 2))
 
-        # Show bookmark status
-        if team_id in bookmarked_teams:
-            bookmark_label = ctk.CTkLabel(
-                top_frame,
-                text="★ Bookmarked (Ctrl+B to remove)",
-                font=ctk.CTkFont(size=12),
-                text_color="gold"
-            )
-            bookmark_label.grid(row=1, column=1, sticky="w", padx=5)
-        else:
-            bookmark_label = ctk.CTkLabel(
-                top_frame,
-                text="Press Ctrl+B to bookmark",
-                font=ctk.CTkFont(size=12),
-                text_color="gray"
-            )
-            bookmark_label.grid(row=1, column=1, sticky="w", padx=5)
+        self.team_bookmark_label = ctk.CTkLabel(
+            top_frame,
+            text="",
+            font=ctk.CTkFont(size=12)
+        )
+        self.team_bookmark_label.grid(row=1, column=1, sticky="w", padx=5)
 
         stats_frame = ctk.CTkFrame(self.team_tab)
         stats_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 5))
         for i in range(4):
             stats_frame.grid_columnconfigure(i, weight=1)
 
-        rep_stars = self._to_stars(team_obj.get("reputationFactor", 0))
-        fin_stars = self._to_stars(team_obj.get("financial", 0))
-
-        ctk.CTkLabel(
-            stats_frame,
-            text=f"Reputation: {rep_stars}"
-        ).grid(row=0, column=0, padx=5, pady=2, sticky="w")
-        ctk.CTkLabel(
-            stats_frame,
-            text=f"Finance: {fin_stars}"
-        ).grid(row=0, column=1, padx=5, pady=2, sticky="w")
-        ctk.CTkLabel(
-            stats_frame,
-            text=f"Dev rate: {team_obj.get('devRate', 0)}"
-        ).grid(row=0, column=2, padx=5, pady=2, sticky="w")
-
-        ctk.CTkLabel(
-            stats_frame,
-            text=f"Attack: {team_obj.get('attack', 0)}"
-        ).grid(row=1, column=0, padx=5, pady=2, sticky="w")
-        ctk.CTkLabel(
-            stats_frame,
-            text=f"Midfield: {team_obj.get('midfield', 0)}"
-        ).grid(row=1, column=1, padx=5, pady=2, sticky="w")
-        ctk.CTkLabel(
-            stats_frame,
-            text=f"Defense: {team_obj.get('defense', 0)}"
-        ).grid(row=1, column=2, padx=5, pady=2, sticky="w")
-        ctk.CTkLabel(
-            stats_frame,
-            text=f"GK: {team_obj.get('goalkeeping', 0)}"
-        ).grid(row=1, column=3, padx=5, pady=2, sticky="w")
+        # key -> label, laid out as (row, column)
+        self._team_stat_labels = {}
+        for key, row, col in (("rep", 0, 0), ("fin", 0, 1), ("dev", 0, 2),
+                              ("attack", 1, 0), ("midfield", 1, 1),
+                              ("defense", 1, 2), ("gk", 1, 3)):
+            label = ctk.CTkLabel(stats_frame, text="")
+            label.grid(row=row, column=col, padx=5, pady=2, sticky="w")
+            self._team_stat_labels[key] = label
 
         lower_frame = ctk.CTkFrame(self.team_tab)
         lower_frame.grid(row=2, column=0, sticky="nsew", padx=10, pady=(5, 10))
@@ -1680,13 +2268,115 @@ class App(ctk.CTk):
             row=0, column=0, sticky="w", padx=5, pady=(3, 2)
         )
 
+        # Trophy icons vary per team, so they live in a body frame that is refilled
+        self.team_trophies_body = ctk.CTkFrame(trophies_frame, fg_color="transparent")
+        self.team_trophies_body.grid(row=1, column=0, sticky="nsew")
+        self.team_trophies_body.grid_columnconfigure(0, weight=1)
+
+        records_frame = ctk.CTkFrame(lower_frame)
+        records_frame.grid(row=1, column=0, sticky="nsew", padx=(0, 5), pady=0)
+        records_frame.rowconfigure(1, weight=1)
+        records_frame.columnconfigure(0, weight=1)
+
+        ctk.CTkLabel(records_frame, text="Season records").grid(
+            row=0, column=0, sticky="w", padx=5, pady=(5, 0)
+        )
+        self.team_records_box = ctk.CTkTextbox(records_frame, wrap="word")
+        self.team_records_box.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+
+        graph_frame = ctk.CTkFrame(lower_frame)
+        graph_frame.grid(row=1, column=1, sticky="nsew", padx=(5, 0), pady=0)
+        graph_frame.rowconfigure(1, weight=1)
+        graph_frame.rowconfigure(3, weight=1)
+        graph_frame.columnconfigure(0, weight=1)
+
+        ctk.CTkLabel(graph_frame, text="Ratings over seasons").grid(
+            row=0, column=0, sticky="w", padx=5, pady=(5, 0)
+        )
+
+        self.team_canvas_ratings = tk.Canvas(graph_frame, highlightthickness=0)
+        self.team_canvas_ratings.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+
+        ctk.CTkLabel(graph_frame, text="League positions over seasons").grid(
+            row=2, column=0, sticky="w", padx=5, pady=(5, 0)
+        )
+
+        self.team_canvas_pos = tk.Canvas(graph_frame, highlightthickness=0)
+        self.team_canvas_pos.grid(row=3, column=0, sticky="nsew", padx=5, pady=5)
+        self._team_graph_sig = None
+        self._ratings_frame_key = None
+        self._pos_frame_key = None
+
+    def _set_team_bookmark_label(self, bookmarked):
+        """Show bookmark status on the team tab."""
+        if bookmarked:
+            self.team_bookmark_label.configure(text="★ Bookmarked (Ctrl+B to remove)", text_color="gold")
+        else:
+            self.team_bookmark_label.configure(text="Press Ctrl+B to bookmark", text_color="gray")
+
+    @staticmethod
+    def _team_tab_signature(team_id, info, bookmarked):
+        """Everything shown on the team tab that can change between opens."""
+        return (team_id, sim.CURRENT_SEASON, len(info.get("records", [])),
+                bookmarked, current_theme)
+
+    def _open_team_tab(self, team_id):
+        """Open and populate team detail tab."""
+        info = sim.TEAM_HISTORY.get(team_id)
+        team_obj = sim.TEAM_ID_MAP.get(team_id)
+        if info is None or team_obj is None:
+            self._team_tab_sig = None
+            self._build_empty_team_tab()
+            self.notebook.select(self.team_tab)
+            return
+
+        # Skip the rebuild when nothing shown on the tab has changed
+        sig = self._team_tab_signature(team_id, info, team_id in bookmarked_teams)
+        self.current_team_id = team_id
+        if sig == self._team_tab_sig:
+            self.notebook.select(self.team_tab)
+            return
+
+        if self.team_records_box is None:
+            self._build_team_tab_skeleton()
+        self._team_tab_sig = sig
+        self._trophy_images = []
+
+        self._load_logo_image(team_id, size=(64, 64))
+        if self._team_logo_image is not None:
+            self.team_logo_label.configure(image=self._team_logo_image)
+            self.team_logo_label.grid()
+        else:
+            self.team_logo_label.grid_remove()
+
+        self.team_name_label.configure(text=info.get("name", ""))
+
+        self._set_team_bookmark_label(team_id in bookmarked_teams)
+
+        rep_stars = self._to_stars(team_obj.get("reputationFactor", 0))
+        fin_stars = self._to_stars(team_obj.get("financial", 0))
+
+        stat_labels = self._team_stat_labels
+        stat_labels["rep"].configure(text=f"Reputation: {rep_stars}")
+        stat_labels["fin"].configure(text=f"Finance: {fin_stars}")
+        stat_labels["dev"].configure(text=f"Dev rate: {team_obj.get('devRate', 0)}")
+        stat_labels["attack"].configure(text=f"Attack: {team_obj.get('attack', 0)}")
+        stat_labels["midfield"].configure(text=f"Midfield: {team_obj.get('midfield', 0)}")
+        stat_labels["defense"].configure(text=f"Defense: {team_obj.get('defense', 0)}")
+        stat_labels["gk"].configure(text=f"GK: {team_obj.get('goalkeeping', 0)}")
+
+        trophies_frame = self.team_trophies_body
+        for w in trophies_frame.winfo_children():
+            w.destroy()
+
         trophies = self._compute_trophies(team_id, team_obj, info)
         if trophies:
             image_trophies = []
             text_trophies = []
+            name_get = sim.COMP_NAME_LOOKUP.get
 
-            for cid, count in sorted(trophies.items(), key=lambda kv: -kv[1]):
-                comp_name = sim.COMP_NAME_LOOKUP.get(cid, f"Comp {cid}")
+            for cid, count in sorted(trophies.items(), key=operator.itemgetter(1), reverse=True):
+                comp_name = name_get(cid, f"Comp {cid}")
                 icon = self._load_trophy_image(cid, size=(36, 36))
                 if icon is not None:
                     image_trophies.append((cid, comp_name, icon, count))
@@ -1696,7 +2386,7 @@ class App(ctk.CTk):
             if image_trophies:
                 for col, (cid, comp_name, icon, count) in enumerate(image_trophies):
                     icon_label = ctk.CTkLabel(trophies_frame, image=icon, text="")
-                    icon_label.grid(row=1, column=col, padx=10, pady=(4, 0))
+                    icon_label.grid(row=0, column=col, padx=10, pady=(4, 0))
                     SimpleTooltip(icon_label, comp_name)
                     icon_label.bind("<Button-1>", lambda e, cc=cid: self._open_competition_tab(cc))
                     amt_label = ctk.CTkLabel(
@@ -1704,10 +2394,10 @@ class App(ctk.CTk):
                         text=str(count),
                         font=ctk.CTkFont(size=14, weight="bold")
                     )
-                    amt_label.grid(row=2, column=col, padx=10, pady=(0, 6))
+                    amt_label.grid(row=1, column=col, padx=10, pady=(0, 6))
 
             if text_trophies:
-                start_row = 3
+                start_row = 2
                 for i, (comp_name, count) in enumerate(text_trophies):
                     row_frame = ctk.CTkFrame(trophies_frame, fg_color="transparent")
                     row_frame.grid(row=start_row + i, column=0, sticky="w", padx=5, pady=2)
@@ -1716,66 +2406,92 @@ class App(ctk.CTk):
             ctk.CTkLabel(
                 trophies_frame,
                 text="No trophies recorded yet."
-            ).grid(row=1, column=0, sticky="w", padx=5, pady=(0, 4))
-
-        records_frame = ctk.CTkFrame(lower_frame)
-        records_frame.grid(row=1, column=0, sticky="nsew", padx=(0, 5), pady=0)
-        records_frame.rowconfigure(1, weight=1)
-        records_frame.columnconfigure(0, weight=1)
-
-        ctk.CTkLabel(records_frame, text="Season records").grid(
-            row=0, column=0, sticky="w", padx=5, pady=(5, 0)
-        )
-        records_box = ctk.CTkTextbox(records_frame, wrap="word")
-        records_box.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+            ).grid(row=0, column=0, sticky="w", padx=5, pady=(0, 4))
 
+        records_box = self.team_records_box
         records_box.configure(state="normal")
-        records = info.get("records", [])
-        records_sorted = sorted(records, key=lambda r: (r.get("season", 0), r.get("type", "")))
-        last_season = None
-        for r in records_sorted:
-            s = r.get("season", 0)
-            if s != last_season:
-                records_box.insert("end", f"\nSeason {s}\n")
-                last_season = s
-            if r.get("type") == "league":
-                records_box.insert(
-                    "end",
-                    f"  {r.get('compName')}: Position: {r.get('position')} "
-                    f"Pts {r.get('points')} GD: {r.get('gd')}\n"
-                )
-            elif r.get("type") == "cup":
-                desc = f"  {r.get('compName')}: Reached {r.get('best_round')}"
-                if r.get("winner"):
-                    desc += " (Winner)"
-                records_box.insert("end", desc + "\n")
-            elif r.get("type") == "continental":
-                desc = f"  {r.get('compName')}: {r.get('stage', 'Participated')}"
-                if r.get("winner"):
-                    desc += " (Winner!)"
-                elif r.get("qualified"):
-                    desc += " (Qualified)"
-                records_box.insert("end", desc + "\n")
+        records_box.delete("1.0", "end")
+        records_box.insert("end", self._records_text(team_id, info))
         records_box.configure(state="disabled")
 
-        graph_frame = ctk.CTkFrame(lower_frame)
-        graph_frame.grid(row=1, column=1, sticky="nsew", padx=(5, 0), pady=0)
-        graph_frame.rowconfigure(1, weight=1)
-        graph_frame.rowconfigure(3, weight=1)
-        graph_frame.columnconfigure(0, weight=1)
-
-        ctk.CTkLabel(graph_frame, text="Ratings over seasons").grid(
-            row=0, column=0, sticky="w", padx=5, pady=(5, 0)
-        )
+        # Show the tab first; the graphs are drawn once Tk is idle
+        if self._team_graph_sig is not None and self._team_graph_sig[0] != team_id:
+            self.team_canvas_ratings.delete("!frame")
+            self.team_canvas_pos.delete("!frame")
+            self._team_graph_sig = None
+        self.notebook.select(self.team_tab)
+        self.after_idle(self._render_team_graphs, team_id)
 
-        canvas_ratings = tk.Canvas(graph_frame, bg="#111111" if current_theme == "dark" else "#ffffff", 
-                                   highlightthickness=0)
-        canvas_ratings.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+    def _render_team_graphs(self, team_id):
+        """Draw the team graphs unless the user has moved on to another team."""
+        if team_id != self.current_team_id or self.team_records_box is None:
+            return
+        info = sim.TEAM_HISTORY.get(team_id)
+        if info is None:
+            return
 
+        # Redraw the graphs only when the plotted data or theme changed
         ratings = info.get("ratings", [])
-        if ratings:
-            width = 360
-            height = 200
+        positions_by_season = self._league_positions_by_season(team_id, info)
+        graph_sig = (
+            team_id, current_theme,
+            tuple((r.get("season"), r.get("attack"), r.get("midfield"),
+                   r.get("defense"), r.get("goalkeeping")) for r in ratings),
+            tuple(sorted((season, p["position"]) for season, p in positions_by_season.items())),
+        )
+        if graph_sig != self._team_graph_sig:
+            self._draw_team_graphs(ratings, positions_by_season)
+            self._team_graph_sig = graph_sig
+
+    def _records_text(self, team_id, info):
+        """Format a team's season-by-season records (cached per history length)."""
+        records = info.get("records", [])
+        key = (team_id, len(records))
+        cached = self._records_text_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # record_history always writes "season" and "type"
+        records_sorted = sorted(records, key=operator.itemgetter("season", "type"))
+        lines = []
+        for s, season_records in itertools.groupby(records_sorted, key=operator.itemgetter("season")):
+            lines.append(f"\nSeason {s}\n")
+            for r in season_records:
+                if r.get("type") == "league":
+                    lines.append(
+                        f"  {r.get('compName')}: Position: {r.get('position')} "
+                        f"Pts {r.get('points')} GD: {r.get('gd')}\n"
+                    )
+                elif r.get("type") == "cup":
+                    desc = f"  {r.get('compName')}: Reached {r.get('best_round')}"
+                    if r.get("winner"):
+                        desc += " (Winner)"
+                    lines.append(desc + "\n")
+                elif r.get("type") == "continental":
+                    desc = f"  {r.get('compName')}: {r.get('stage', 'Participated')}"
+                    if r.get("winner"):
+                        desc += " (Winner!)"
+                    elif r.get("qualified"):
+                        desc += " (Qualified)"
+                    lines.append(desc + "\n")
+        text = "".join(lines)
+        self._records_text_cache[key] = text
+        return text
+
+    def _draw_team_graphs(self, ratings, positions_by_season):
+        """Draw the ratings and league position graphs on the team tab canvases."""
+        canvas_bg = "#111111" if current_theme == "dark" else "#ffffff"
+        canvas_ratings = self.team_canvas_ratings
+        canvas_ratings.configure(bg=canvas_bg)
+
+        # Axes, gridlines and legend only depend on the theme, so they are
+        # kept across redraws (tag "frame") and only the data is redrawn.
+        if not ratings:
+            canvas_ratings.delete("all")
+            self._ratings_frame_key = None
+        else:
+            width = GRAPH_WIDTH
+            height = GRAPH_HEIGHT
             canvas_ratings.configure(width=width, height=height)
             seasons_r = [r["season"] for r in ratings]
             seasons_r_sorted = sorted(seasons_r)
@@ -1783,91 +2499,96 @@ class App(ctk.CTk):
             max_s = max(seasons_r_sorted)
             if max_s == min_s:
                 max_s += 1
-            attrs = ["attack", "midfield", "defense", "goalkeeping"]
-            colors = {
-                "attack": "red",
-                "midfield": "yellow",
-                "defense": "cyan",
-                "goalkeeping": "magenta"
-            }
-            min_val = 50
-            max_val = 100
-            margin = 30
+            min_val = RATING_MIN
+            max_val = RATING_MAX
+            margin = GRAPH_MARGIN
 
             # Grid lines
             line_color = "#555555" if current_theme == "dark" else "#cccccc"
             text_color = "#bbbbbb" if current_theme == "dark" else "#444444"
-            
-            canvas_ratings.create_line(
-                margin, height - margin, width - margin, height - margin, fill=line_color
-            )
-            canvas_ratings.create_line(
-                margin, margin, margin, height - margin, fill=line_color
-            )
-
-            for y_val in range(min_val, max_val + 1, 10):
-                y = height - margin - (y_val - min_val) / (max_val - min_val) * (height - 2 * margin)
-                canvas_ratings.create_line(margin, y, width - margin, y, fill="#222222" if current_theme == "dark" else "#eeeeee")
-                canvas_ratings.create_text(
-                    margin - 10, y, text=str(y_val), fill=text_color, anchor="e", font=("Arial", 8)
-                )
-
-            seasons_unique = seasons_r_sorted
-            n_seasons = len(seasons_unique)
-            for i, s in enumerate(seasons_unique):
-                x = margin + i / max(1, n_seasons - 1) * (width - 2 * margin)
-                canvas_ratings.create_text(
-                    x, height - margin + 10, text=str(s), fill=text_color, anchor="n", font=("Arial", 8)
-                )
 
-            for attr in attrs:
-                points = []
-                for i, s in enumerate(seasons_unique):
-                    for r in ratings:
-                        if r["season"] == s:
-                            v = r.get(attr, 0)
-                            break
-                    else:
-                        v = None
-                    if v is None:
-                        continue
-                    x = margin + i / max(1, n_seasons - 1) * (width - 2 * margin)
-                    v_clamped = max(min_val, min(max_val, v))
-                    y = height - margin - (v_clamped - min_val) / (max_val - min_val) * (height - 2 * margin)
-                    points.append((x, y))
-                if len(points) >= 2:
-                    flat = []
-                    for x, y in points:
-                        flat.extend([x, y])
-                    canvas_ratings.create_line(flat, fill=colors.get(attr, "white"), width=2)
-                elif len(points) == 1:
-                    x, y = points[0]
-                    canvas_ratings.create_oval(x - 2, y - 2, x + 2, y + 2, fill=colors.get(attr, "white"))
-
-            legend_y = margin
-            for attr in attrs:
-                col = colors.get(attr, "white")
+            if self._ratings_frame_key == current_theme:
+                canvas_ratings.delete("!frame")
+            else:
+                canvas_ratings.delete("all")
+                self._ratings_frame_key = current_theme
                 canvas_ratings.create_line(
-                    width - margin - 50, legend_y, width - margin - 30, legend_y, fill=col, width=2
+                    margin, height - margin, width - margin, height - margin, fill=line_color, tags="frame"
                 )
-                canvas_ratings.create_text(
-                    width - margin - 25, legend_y, text=attr[:3].upper(), fill=text_color, anchor="w",
-                    font=("Arial", 8)
+                canvas_ratings.create_line(
+                    margin, margin, margin, height - margin, fill=line_color, tags="frame"
                 )
-                legend_y += 12
 
-        ctk.CTkLabel(graph_frame, text="League positions over seasons").grid(
-            row=2, column=0, sticky="w", padx=5, pady=(5, 0)
-        )
+                for y_val in range(min_val, max_val + 1, 10):
+                    y = height - margin - (y_val - min_val) / (max_val - min_val) * (height - 2 * margin)
+                    canvas_ratings.create_line(margin, y, width - margin, y, fill="#222222" if current_theme == "dark" else "#eeeeee",
+                                               tags="frame")
+                    canvas_ratings.create_text(
+                        margin - 10, y, text=str(y_val), fill=text_color, anchor="e", font=("Arial", 8), tags="frame"
+                    )
 
-        canvas_pos = tk.Canvas(graph_frame, bg="#111111" if current_theme == "dark" else "#ffffff", 
-                              highlightthickness=0)
-        canvas_pos.grid(row=3, column=0, sticky="nsew", padx=5, pady=5)
+                legend_y = margin
+                for _, col, label in RATING_SERIES:
+                    canvas_ratings.create_line(
+                        width - margin - 50, legend_y, width - margin - 30, legend_y, fill=col, width=2,
+                        tags=("frame", "legend")
+                    )
+                    canvas_ratings.create_text(
+                        width - margin - 25, legend_y, text=label, fill=text_color, anchor="w",
+                        font=("Arial", 8), tags=("frame", "legend")
+                    )
+                    legend_y += 12
 
-        positions_by_season = self._league_positions_by_season(info)
-        if positions_by_season:
-            width_p = 360
-            height_p = 200
+            seasons_unique = seasons_r_sorted
+            n_seasons = len(seasons_unique)
+            xs = [margin + i / max(1, n_seasons - 1) * (width - 2 * margin) for i in range(n_seasons)]
+            create_text = canvas_ratings.create_text
+            tick_y = height - margin + 10
+            for x, s in zip(xs, seasons_unique):
+                create_text(x, tick_y, text=str(s), fill=text_color, anchor="n", font=("Arial", 8))
+
+            # First rating entry per season, looked up once instead of per attribute
+            by_season = {}
+            for r in ratings:
+                by_season.setdefault(r["season"], r)
+            y_scale = (height - 2 * margin) / (max_val - min_val)
+            # y of a zero rating, so each point is a single multiply-subtract
+            y_zero = height - margin + min_val * y_scale
+            y_floor = height - margin
+            y_ceil = margin
+
+            for attr, col, _ in RATING_SERIES:
+                flat = []
+                append = flat.append
+                values = [by_season[s].get(attr, 0) for s in seasons_unique]
+                for x, v in zip(xs, values):
+                    if v is None:
+                        continue
+                    append(x)
+                    if v <= min_val:
+                        append(y_floor)
+                    elif v >= max_val:
+                        append(y_ceil)
+                    else:
+                        append(y_zero - v * y_scale)
+                if len(flat) >= 4:
+                    canvas_ratings.create_line(flat, fill=col, width=2)
+                elif len(flat) == 2:
+                    x, y = flat
+                    canvas_ratings.create_oval(x - 2, y - 2, x + 2, y + 2, fill=col)
+
+            # Keep the legend above the freshly drawn series
+            canvas_ratings.tag_raise("legend")
+
+        canvas_pos = self.team_canvas_pos
+        canvas_pos.configure(bg=canvas_bg)
+
+        if not positions_by_season:
+            canvas_pos.delete("all")
+            self._pos_frame_key = None
+        else:
+            width_p = GRAPH_WIDTH
+            height_p = GRAPH_HEIGHT
             canvas_pos.configure(width=width_p, height=height_p)
 
             seasons_p = sorted(positions_by_season.keys())
@@ -1876,48 +2597,54 @@ class App(ctk.CTk):
             max_pos = max(pos_vals)
             if max_pos == min_pos:
                 max_pos += 1
-            margin_p = 30
+            margin_p = GRAPH_MARGIN
 
             line_color = "#555555" if current_theme == "dark" else "#cccccc"
             text_color = "#bbbbbb" if current_theme == "dark" else "#444444"
 
-            canvas_pos.create_line(
-                margin_p, margin_p, margin_p, height_p - margin_p, fill=line_color
-            )
-            canvas_pos.create_line(
-                margin_p, height_p - margin_p, width_p - margin_p, height_p - margin_p, fill=line_color
-            )
-
-            for pos in range(min_pos, max_pos + 1):
-                frac = (pos - min_pos) / (max_pos - min_pos)
-                y = margin_p + frac * (height_p - 2 * margin_p)
-                canvas_pos.create_line(margin_p, y, width_p - margin_p, y, fill="#222222" if current_theme == "dark" else "#eeeeee")
-                canvas_pos.create_text(
-                    margin_p - 10, y, text=str(pos), fill=text_color, anchor="e", font=("Arial", 8)
+            # The frame depends on the theme and the position range only
+            frame_key = (current_theme, max_pos)
+            if self._pos_frame_key == frame_key:
+                canvas_pos.delete("!frame")
+            else:
+                canvas_pos.delete("all")
+                self._pos_frame_key = frame_key
+                canvas_pos.create_line(
+                    margin_p, margin_p, margin_p, height_p - margin_p, fill=line_color, tags="frame"
+                )
+                canvas_pos.create_line(
+                    margin_p, height_p - margin_p, width_p - margin_p, height_p - margin_p, fill=line_color,
+                    tags="frame"
                 )
 
+                for pos in range(min_pos, max_pos + 1):
+                    frac = (pos - min_pos) / (max_pos - min_pos)
+                    y = margin_p + frac * (height_p - 2 * margin_p)
+                    canvas_pos.create_line(margin_p, y, width_p - margin_p, y,
+                                           fill="#222222" if current_theme == "dark" else "#eeeeee", tags="frame")
+                    canvas_pos.create_text(
+                        margin_p - 10, y, text=str(pos), fill=text_color, anchor="e", font=("Arial", 8),
+                        tags="frame"
+                    )
+
             n_seasons = len(seasons_p)
+            x_step = (width_p - 2 * margin_p) / max(1, n_seasons - 1)
+            y_step = (height_p - 2 * margin_p) / (max_pos - min_pos)
+            tick_y = height_p - margin_p + 10
+            create_text = canvas_pos.create_text
             points = []
-            for i, s in enumerate(seasons_p):
-                pos = positions_by_season[s]["position"]
-                x = margin_p + i / max(1, n_seasons - 1) * (width_p - 2 * margin_p)
-                frac = (pos - min_pos) / (max_pos - min_pos)
-                y = margin_p + frac * (height_p - 2 * margin_p)
+            for i, (s, pos) in enumerate(zip(seasons_p, pos_vals)):
+                x = margin_p + i * x_step
+                y = margin_p + (pos - min_pos) * y_step
                 points.append((x, y))
-                canvas_pos.create_text(
-                    x, height_p - margin_p + 10, text=str(s), fill=text_color, anchor="n", font=("Arial", 8)
-                )
+                create_text(x, tick_y, text=str(s), fill=text_color, anchor="n", font=("Arial", 8))
 
             if len(points) >= 2:
-                flat = []
-                for x, y in points:
-                    flat.extend([x, y])
-                canvas_pos.create_line(flat, fill="white", width=2)
+                canvas_pos.create_line([c for point in points for c in point], fill="white", width=2)
 
-            for (x, y), s in zip(points, seasons_p):
-                canvas_pos.create_oval(x - 3, y - 3, x + 3, y + 3, outline="yellow", fill="yellow")
-
-        self.notebook.select(self.team_tab)
+            create_oval = canvas_pos.create_oval
+            for x, y in points:
+                create_oval(x - 3, y - 3, x + 3, y + 3, outline="yellow", fill="yellow")
 
 # ==================== Main Entry Point ====================
 
@@ -2,11 +2,14 @@ import os
 import json
 import random
 import math
+import re
 from typing import Dict, List, Tuple, Any, Optional
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 
+_SLUG_RE = re.compile(r"[\W_]+")
+
 # Global data structures
 CONTINENTS = []
 POSITIONS = []
@@ -46,7 +49,7 @@ def _load_json(path: str, default: Any = None) -> Any:
 
 def _slug(s: str) -> str:
     """Convert string to slug format."""
-    return "".join(ch for ch in s.lower() if ch.isalnum())
+    return _SLUG_RE.sub("", s.lower())
 
 
 def load_root_data() -> None:
@@ -333,68 +336,64 @@ def simSeason(team_stats_by_key: Dict[int, List[Dict]]) -> Dict[int, Dict]:
     
     for key, teams in team_stats_by_key.items():
         teams = [dict(t) for t in teams]
+        n = len(teams)
 
-        table = {}
-        for i, t in enumerate(teams):
-            table[i] = {
-                "teamId": t.get("teamId", i),
-                "teamName": t.get("teamName", f"Team {i}"),
-                "played": 0,
-                "wins": 0,
-                "draws": 0,
-                "losses": 0,
-                "gf": 0,
-                "ga": 0,
-                "gd": 0,
-                "points": 0,
-                "reputationFactor": t.get("reputationFactor", 0)
-            }
+        # Per-column tallies indexed by team position; rows are built once at the end
+        wins = [0] * n
+        draws = [0] * n
+        losses = [0] * n
+        gf = [0] * n
+        ga = [0] * n
+        names = [t.get("teamName", f"Team {i}") for i, t in enumerate(teams)]
 
         fixtures = _build_fixtures(teams)
         match_results = []
 
         for home_idx, away_idx in fixtures:
-            home = teams[home_idx]
-            away = teams[away_idx]
+            goals_home, goals_away = _simulate_match(teams[home_idx], teams[away_idx], force_winner=False)
 
-            goals_home, goals_away = _simulate_match(home, away, force_winner=False)
-
-            table[home_idx]["played"] += 1
-            table[away_idx]["played"] += 1
-
-            table[home_idx]["gf"] += goals_home
-            table[home_idx]["ga"] += goals_away
-            table[away_idx]["gf"] += goals_away
-            table[away_idx]["ga"] += goals_home
+            gf[home_idx] += goals_home
+            ga[home_idx] += goals_away
+            gf[away_idx] += goals_away
+            ga[away_idx] += goals_home
 
             if goals_home > goals_away:
-                table[home_idx]["wins"] += 1
-                table[away_idx]["losses"] += 1
-                table[home_idx]["points"] += 3
+                wins[home_idx] += 1
+                losses[away_idx] += 1
             elif goals_home < goals_away:
-                table[away_idx]["wins"] += 1
-                table[home_idx]["losses"] += 1
-                table[away_idx]["points"] += 3
+                wins[away_idx] += 1
+                losses[home_idx] += 1
             else:
-                table[home_idx]["draws"] += 1
-                table[away_idx]["draws"] += 1
-                table[home_idx]["points"] += 1
-                table[away_idx]["points"] += 1
+                draws[home_idx] += 1
+                draws[away_idx] += 1
 
             match_results.append({
                 "home_idx": home_idx,
                 "away_idx": away_idx,
-                "home_team": table[home_idx]["teamName"],
-                "away_team": table[away_idx]["teamName"],
+                "home_team": names[home_idx],
+                "away_team": names[away_idx],
                 "home_goals": goals_home,
                 "away_goals": goals_away
             })
 
-        for i in table:
-            table[i]["gd"] = table[i]["gf"] - table[i]["ga"]
+        table = []
+        for i, t in enumerate(teams):
+            table.append({
+                "teamId": t.get("teamId", i),
+                "teamName": names[i],
+                "played": wins[i] + draws[i] + losses[i],
+                "wins": wins[i],
+                "draws": draws[i],
+                "losses": losses[i],
+                "gf": gf[i],
+                "ga": ga[i],
+                "gd": gf[i] - ga[i],
+                "points": 3 * wins[i] + draws[i],
+                "reputationFactor": t.get("reputationFactor", 0)
+            })
 
         sorted_table = sorted(
-            table.values(),
+            table,
             key=lambda r: (-r["points"], -r["gd"], -r["gf"], -r.get("reputationFactor", 0))
         )
 